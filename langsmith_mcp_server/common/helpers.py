@@ -1,15 +1,54 @@
 """Helper functions for the LangSmith MCP server."""
 
+import base64
+import hashlib
+import json
 import os
 import re
+import threading
+from collections import OrderedDict
+from contextvars import ContextVar
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
 from fastmcp.server import Context
 from langsmith import Client
 
+# LangSmith client resolved for the tool call currently being handled.
+# Set by LangSmithClientMiddleware so tools can skip resolving it from the context.
+client_context: ContextVar[Optional[Client]] = ContextVar("langsmith_client", default=None)
+
+# LangSmith clients by (API key hash, workspace ID, endpoint), least recently used first
+_CLIENT_CACHE_SIZE = 128
+_client_cache: "OrderedDict[Tuple[str, Optional[str], Optional[str]], Client]" = OrderedDict()
+_client_cache_lock = threading.Lock()
+
+
+def _set_client_environment(
+    api_key: str, workspace_id: Optional[str] = None, endpoint: Optional[str] = None
+) -> None:
+    """Set the LangSmith environment variables that some SDK operations read."""
+    os.environ["LANGSMITH_API_KEY"] = api_key
+    if workspace_id:
+        os.environ["LANGSMITH_WORKSPACE_ID"] = workspace_id
+    if endpoint:
+        os.environ["LANGSMITH_ENDPOINT"] = endpoint
+
+
+def _create_client(
+    api_key: str, workspace_id: Optional[str] = None, endpoint: Optional[str] = None
+) -> Client:
+    """Initialize a LangSmith client with the given configuration."""
+    client_kwargs = {"api_key": api_key}
+    if workspace_id:
+        client_kwargs["workspace_id"] = workspace_id
+    if endpoint:
+        client_kwargs["api_url"] = endpoint
+
+    return Client(**client_kwargs)
+
 
 def get_langsmith_client_from_api_key(
     api_key: str, workspace_id: Optional[str] = None, endpoint: Optional[str] = None
@@ -25,21 +64,62 @@ def get_langsmith_client_from_api_key(
     Returns:
         LangSmith Client instance
     """  # noqa: W293
-    # Set environment variables for LangSmith client (some SDK operations read from env)
-    os.environ["LANGSMITH_API_KEY"] = api_key
-    if workspace_id:
-        os.environ["LANGSMITH_WORKSPACE_ID"] = workspace_id
-    if endpoint:
-        os.environ["LANGSMITH_ENDPOINT"] = endpoint
+    _set_client_environment(api_key, workspace_id=workspace_id, endpoint=endpoint)
+    return _create_client(api_key, workspace_id=workspace_id, endpoint=endpoint)
 
-    # Initialize the LangSmith client with parameters
-    client_kwargs = {"api_key": api_key}
-    if workspace_id:
-        client_kwargs["workspace_id"] = workspace_id
-    if endpoint:
-        client_kwargs["api_url"] = endpoint
 
-    return Client(**client_kwargs)
+def _hash_api_key(api_key: str) -> str:
+    """Hash an API key, so caches can be keyed on it without holding the key itself."""
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+def client_config_key(client: Client) -> Tuple[str, Optional[str], str]:
+    """
+    Identify the configuration of a LangSmith client without holding its API key.
+
+    Args:
+        client: LangSmith Client instance
+
+    Returns:
+        Tuple of the API key hash, the workspace ID and the API URL
+    """  # noqa: W293
+    return (_hash_api_key(client.api_key or ""), client.workspace_id, client.api_url)
+
+
+def _get_cached_client(
+    api_key: str, workspace_id: Optional[str] = None, endpoint: Optional[str] = None
+) -> Client:
+    """
+    Get a LangSmith client for the given configuration, reusing a previously created one.
+
+    Creating a client sets up its HTTP session, so clients are cached per
+    (api_key, workspace_id, endpoint) and shared across tool calls and sessions.
+    The cache is keyed on a hash of the API key. The environment variables are set
+    on every call, as when creating a new client, so they always match the client
+    returned last.
+    """  # noqa: W293
+    _set_client_environment(api_key, workspace_id=workspace_id, endpoint=endpoint)
+    key = (_hash_api_key(api_key), workspace_id, endpoint)
+    with _client_cache_lock:
+        client = _client_cache.get(key)
+        if client is not None:
+            _client_cache.move_to_end(key)
+            return client
+
+    client = _create_client(api_key, workspace_id=workspace_id, endpoint=endpoint)
+    with _client_cache_lock:
+        # Another thread may have created a client for the same configuration meanwhile
+        client = _client_cache.setdefault(key, client)
+        _client_cache.move_to_end(key)
+        while len(_client_cache) > _CLIENT_CACHE_SIZE:
+            _client_cache.popitem(last=False)
+    return client
+
+
+def _clear_client_cache() -> None:
+    """Drop all cached LangSmith clients."""
+    with _client_cache_lock:
+        _client_cache.clear()
 
 
 def get_client_from_context(ctx: Context) -> Client:
@@ -53,6 +133,9 @@ def get_client_from_context(ctx: Context) -> Client:
     On first HTTP request, config is extracted from headers and stored in session.
     On subsequent HTTP requests, config is retrieved from session state.
     For STDIO, config is always read from environment variables.
+    Clients are cached per configuration, so repeated calls reuse the same client.
+    Inside a tool call handled by LangSmithClientMiddleware, the client it resolved
+    is returned directly.
 
     Args:
         ctx: FastMCP context (automatically provided to tools)
@@ -63,6 +146,11 @@ def get_client_from_context(ctx: Context) -> Client:
     Raises:
         ValueError: If API key is not found in headers (HTTP) or environment (STDIO)
     """  # noqa: W293
+    # Reuse the client already resolved for this tool call, if any
+    client = client_context.get()
+    if client is not None:
+        return client
+
     # Try to get config from session state (set on first HTTP request)
     api_key = ctx.get_state("api_key")
     workspace_id = ctx.get_state("workspace_id") or None
@@ -103,7 +191,68 @@ def get_client_from_context(ctx: Context) -> Client:
             "For STDIO transport, set LANGSMITH_API_KEY environment variable."
         )
 
-    return get_langsmith_client_from_api_key(api_key, workspace_id=workspace_id, endpoint=endpoint)
+    return _get_cached_client(api_key, workspace_id=workspace_id, endpoint=endpoint)
+
+
+def pack_msgpack_response(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Encode a tool result as a base64 MessagePack blob.
+
+    The result must already be JSON-compatible (see convert_uuids_to_strings).
+
+    Args:
+        result: The tool result to encode
+
+    Returns:
+        Dictionary with a single "_binary_msgpack" key holding the base64-encoded blob
+
+    Raises:
+        ValueError: If the msgpack package is not installed
+    """  # noqa: W293
+    try:
+        import msgpack
+    except ImportError as e:
+        raise ValueError(
+            "response_format 'msgpack' requires the msgpack package to be installed on the server"
+        ) from e
+
+    packed = msgpack.packb(result, use_bin_type=True)
+    return {"_binary_msgpack": base64.b64encode(packed).decode("ascii")}
+
+
+def pack_zstd_response(result: Dict[str, Any], level: int = 3) -> Dict[str, Any]:
+    """
+    Encode a tool result as base64 zstd-compressed JSON.
+
+    The result must already be JSON-compatible (see convert_uuids_to_strings).
+
+    Args:
+        result: The tool result to encode
+        level: zstd compression level (default: 3)
+
+    Returns:
+        Dictionary with a single "_zstd_b64" key holding the base64-encoded blob
+
+    Raises:
+        ValueError: If the zstandard package is not installed
+    """  # noqa: W293
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ValueError(
+            "compress 'zstd' requires the zstandard package to be installed on the server"
+        ) from e
+
+    try:
+        import orjson
+
+        payload = orjson.dumps(result)
+    except ImportError:
+        payload = json.dumps(result, separators=(",", ":")).encode("utf-8")
+
+    # Compressors are not safe for concurrent use, so each call gets its own
+    compressed = zstandard.ZstdCompressor(level=level).compress(payload)
+    return {"_zstd_b64": base64.b64encode(compressed).decode("ascii")}
 
 
 def get_langgraph_app_host_name(run_stats: dict) -> Optional[str]:
@@ -147,7 +296,7 @@ def _parse_as_of_parameter(as_of: str) -> Union[datetime, str]:
         return as_of
 
 
-def find_in_dict(data, key):
+def find_in_dict(data: Any, key: str) -> Any:
     """
     Recursively search for a key in a nested dictionary or list.
 
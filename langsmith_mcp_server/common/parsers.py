@@ -0,0 +1,103 @@
+"""Parsers for tool arguments that MCP clients send as strings."""
+
+import json
+import string
+from typing import Any, Dict, List, Optional, Union
+
+try:
+    import orjson
+
+    json_loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+except ImportError:  # orjson is not available on every platform (e.g. PyPy)
+    json_loads = json.loads
+    JSONDecodeError = json.JSONDecodeError
+
+_HEX_DIGITS = frozenset(string.hexdigits)
+
+# Accepted spellings for boolean string arguments, built once at import time.
+# Common casings are included so the lookup usually succeeds without lowercasing.
+_BOOL_MAP: Dict[str, bool] = {
+    "true": True,
+    "True": True,
+    "TRUE": True,
+    "yes": True,
+    "1": True,
+    "false": False,
+    "False": False,
+    "FALSE": False,
+    "no": False,
+    "0": False,
+}
+
+
+def parse_bool(value: Optional[str]) -> Optional[bool]:
+    """
+    Parse a boolean string argument ("true"/"false").
+
+    Returns None if the value is not provided or not a recognized boolean string.
+    """
+    if value is None:
+        return None
+    parsed = _BOOL_MAP.get(value)
+    if parsed is None:
+        parsed = _BOOL_MAP.get(value.lower())
+    return parsed
+
+
+def parse_flag(value: Optional[str]) -> Optional[bool]:
+    """
+    Parse a boolean string argument where unrecognized values count as false.
+
+    Returns None if the value is not provided.
+    """
+    if value is None:
+        return None
+    return parse_bool(value) is True
+
+
+def parse_json_array(value: Union[List[Any], str, None]) -> Optional[List[Any]]:
+    """
+    Parse a list argument given as a list, a JSON array string or a single value.
+
+    Lists are returned as-is and a single (non-array) value is wrapped in a list.
+    Returns None if not provided.
+    """
+    if not value:
+        return None
+    if isinstance(value, list):
+        return value
+    # Single UUIDs (e.g. one example ID) are the most common input: recognize their
+    # shape without any further string processing. A UUID starts with a hex digit,
+    # which rules out JSON arrays (including whitespace-prefixed ones).
+    if len(value) == 36 and value[8] == "-" and value[13] == "-" and value[0] in _HEX_DIGITS:
+        return [value]
+    # Fast path for the common single-value case (e.g. one project name), which would
+    # otherwise pay for a JSON decode error
+    if value.lstrip()[:1] != "[":
+        return [value]
+    try:
+        parsed = json_loads(value)
+    except JSONDecodeError:
+        return [value]
+    return parsed if isinstance(parsed, list) else [value]
+
+
+def parse_json_obj(value: Union[Dict[str, Any], str, None]) -> Optional[Dict[str, Any]]:
+    """
+    Parse a dict argument given as a dict or a JSON object string.
+
+    Returns None if not provided or not a valid JSON object.
+    """
+    if not value:
+        return None
+    if isinstance(value, dict):
+        return value
+    # Only a string starting with "{" can decode to an object; skip decoding anything else.
+    if value.lstrip()[:1] != "{":
+        return None
+    try:
+        parsed = json_loads(value)
+    except JSONDecodeError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
@@ -1,12 +1,17 @@
 """Simple API key authentication middleware for MCP HTTP."""
 
 from contextvars import ContextVar
+from typing import Iterable, Optional
 
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.tools.tool import ToolResult
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 from starlette.status import HTTP_401_UNAUTHORIZED
 
+from langsmith_mcp_server.common.helpers import client_context, get_client_from_context
+
 # Context variables to store LangSmith config for current request
 # These are used to pass config from middleware to FastMCP's session state
 api_key_context: ContextVar[str] = ContextVar("api_key", default="")
@@ -29,7 +34,7 @@ class APIKeyMiddleware(BaseHTTPMiddleware):
     3. LANGSMITH-ENDPOINT (optional)
     """  # noqa: W293
 
-    async def dispatch(self, request: Request, call_next):
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
         # Skip authentication for health check
         if request.url.path == "/health":
             return await call_next(request)
@@ -63,3 +68,35 @@ class APIKeyMiddleware(BaseHTTPMiddleware):
             api_key_context.set("")
             workspace_id_context.set("")
             endpoint_context.set("")
+
+
+class LangSmithClientMiddleware(Middleware):
+    """
+    FastMCP middleware that resolves the LangSmith client once per tool call.
+
+    The client is stored in a context variable for the duration of the call, so
+    get_client_from_context returns it directly inside tools (including operations
+    dispatched by batch_execute). If tool_names is given, the client is only resolved
+    for those tools, so documentation-only tools never build one.
+    """  # noqa: W293
+
+    def __init__(self, tool_names: Optional[Iterable[str]] = None) -> None:
+        self.tool_names = frozenset(tool_names) if tool_names is not None else None
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next: CallNext) -> ToolResult:
+        ctx = context.fastmcp_context
+        if ctx is None or (
+            self.tool_names is not None and context.message.name not in self.tool_names
+        ):
+            return await call_next(context)
+        try:
+            client = get_client_from_context(ctx)
+        except Exception:
+            # Let the tool itself report the error, like any other failure it handles
+            return await call_next(context)
+
+        token = client_context.set(client)
+        try:
+            return await call_next(context)
+        finally:
+            client_context.reset(token)
@@ -12,15 +12,17 @@ from starlette.middleware.cors import CORSMiddleware
 from starlette.requests import Request
 from starlette.responses import PlainTextResponse
 
-from langsmith_mcp_server.middleware import APIKeyMiddleware
+from langsmith_mcp_server.middleware import APIKeyMiddleware, LangSmithClientMiddleware
 from langsmith_mcp_server.services import (
     register_prompts,
     register_resources,
     register_tools,
 )
+from langsmith_mcp_server.services.register_tools import CLIENT_TOOLS
 
 # Create MCP server
 mcp = FastMCP("LangSmith API MCP Server")
+mcp.add_middleware(LangSmithClientMiddleware(tool_names=CLIENT_TOOLS))
 
 # Register all tools with the server using simplified registration modules
 # Note: Tools will use API key from request.state.api_key (set by middleware)
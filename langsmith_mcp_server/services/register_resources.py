@@ -2,7 +2,14 @@
 
 from fastmcp import FastMCP
 
+from langsmith_mcp_server.services.resources.langsmith_docs import fetch_runs_guide
+
 
 def register_resources(mcp: FastMCP) -> None:
     """Register all resource-related functionality with the MCP server."""
-    pass
+    mcp.resource(
+        "langsmith://docs/fetch_runs",
+        name="fetch_runs_guide",
+        description="Filter Query Language (FQL) reference and examples for the fetch_runs tool.",
+        mime_type="text/markdown",
+    )(fetch_runs_guide)
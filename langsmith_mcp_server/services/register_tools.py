@@ -1,12 +1,40 @@
 """Registration module for LangSmith MCP tools."""
 
+import asyncio
+import functools
+import inspect
 import json
-from typing import Any, Dict, Optional
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextvars import ContextVar
+from dataclasses import astuple
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
 
 from fastmcp import FastMCP
+from fastmcp.exceptions import NotFoundError
 from fastmcp.server import Context
-
-from langsmith_mcp_server.common.helpers import get_client_from_context
+from fastmcp.utilities.types import get_cached_typeadapter
+from langsmith import Client
+
+from langsmith_mcp_server.common.helpers import (
+    _parse_as_of_parameter,
+    client_config_key,
+    get_client_from_context,
+    pack_msgpack_response,
+    pack_zstd_response,
+)
+from langsmith_mcp_server.common.parsers import (
+    JSONDecodeError,
+    json_loads,
+    parse_bool,
+    parse_flag,
+    parse_json_array,
+    parse_json_obj,
+)
 from langsmith_mcp_server.services.tools.datasets import (
     list_datasets_tool,
     list_examples_tool,
@@ -21,1755 +49,2218 @@ from langsmith_mcp_server.services.tools.prompts import (
     list_prompts_tool,
 )
 from langsmith_mcp_server.services.tools.traces import (
-    fetch_runs_tool,
+    FetchRunsParams,
+    iter_runs_tool,
     list_projects_tool,
 )
 
+# Number of runs pulled from the API between fetch_runs progress notifications
+_RUNS_PAGE_SIZE = 100
+
+# read_example results for examples read at a fixed point in time, per client
+# configuration (API key hash, workspace ID, endpoint), least recently used first.
+# Keying on the configuration rather than the Client object means a client recreated
+# for the same configuration shares (and can clear) the same cache.
+_EXAMPLE_CACHE_SIZE = 1024
+_EXAMPLE_CACHE_CONFIGS = 128
+_EXAMPLE_CACHE: "OrderedDict[Tuple[Any, ...], OrderedDict[Tuple[str, str], Dict[str, Any]]]" = (
+    OrderedDict()
+)
+_EXAMPLE_CACHE_LOCK = threading.Lock()
+
+# In-flight read_example requests, keyed by client identity, example ID and as_of.
+# Entries only live while the request is running, so id(client) cannot be reused.
+_INFLIGHT_EXAMPLES: Dict[Tuple[int, str, Optional[str]], "Future[Dict[str, Any]]"] = {}
+_INFLIGHT_EXAMPLES_LOCK = threading.Lock()
+
+# Maximum number of example IDs per bulk list_examples request made by batch_execute
+_PREFETCH_EXAMPLES_CHUNK_SIZE = 100
+
+# In-flight fetch_runs fetches, keyed by client and query parameters, with a progress
+# queue for each caller waiting on them
+_INFLIGHT_RUNS: Dict[
+    Tuple[Any, ...], Tuple["asyncio.Task[List[Dict[str, Any]]]", List["asyncio.Queue[int]"]]
+] = {}
+
+# Set while batch_execute runs its operations. They all share the batch's context and
+# progress token, so nested tools must not report progress of their own on it.
+_in_batch: ContextVar[bool] = ContextVar("in_batch", default=False)
+
+# Arguments of list_examples that need parsing, with their parser; others are passed as-is
+_LIST_EXAMPLES_PARSERS: Dict[str, Callable[[Any], Any]] = {
+    "example_ids": parse_json_array,
+    "splits": parse_json_array,
+    "metadata": parse_json_obj,
+    "inline_s3_urls": parse_flag,
+    "include_attachments": parse_flag,
+}
+
+# String arguments of fetch_runs that need parsing, with their parser:
+# project_name can be a single name or a JSON array, the flags are boolean strings
+_FETCH_RUNS_PARSE_SPEC: Tuple[Tuple[str, Callable[[Optional[str]], Any]], ...] = (
+    ("project_name", parse_json_array),
+    ("error", parse_bool),
+    ("is_root", parse_bool),
+)
 
-def register_tools(mcp: FastMCP) -> None:
-    """
-    Register all LangSmith tool-related functionality with the MCP server.
-    This function configures and registers various tools for interacting with LangSmith,
-    including prompt management, conversation history, traces, and analytics.
 
-    Args:
-        mcp: The MCP server instance to register tools with
+async def _prefetch_examples(
+    operations: List[Any], ctx: Context
+) -> Dict[Tuple[str, Optional[str]], Dict[str, Any]]:
     """
+    Fetch the examples of several read_example operations with bulk list_examples calls.
+
+    Operations are grouped by `as_of`; groups with at least two distinct example IDs
+    are fetched in chunks of _PREFETCH_EXAMPLES_CHUNK_SIZE. Fixed `as_of` timestamps are
+    left to the read_example cache.
+    Returns read_example-shaped results keyed by (example_id, as_of). Examples missing
+    from the result (or a failed bulk call) are simply not prefetched, so those
+    operations fall back to a regular read_example call.
+    """
+    groups: Dict[Optional[str], Dict[str, None]] = {}
+    for operation in operations:
+        if not isinstance(operation, dict) or operation.get("tool") != "read_example":
+            continue
+        args = operation.get("args")
+        if not isinstance(args, dict) or not set(args) <= {"example_id", "as_of"}:
+            continue
+        example_id = args.get("example_id")
+        as_of = args.get("as_of")
+        if not isinstance(example_id, str) or not example_id:
+            continue
+        if (as_of is not None and not isinstance(as_of, str)) or _is_fixed_as_of(as_of):
+            continue
+        groups.setdefault(as_of, {})[example_id] = None
+
+    prefetched: Dict[Tuple[str, Optional[str]], Dict[str, Any]] = {}
+    groups = {as_of: ids for as_of, ids in groups.items() if len(ids) > 1}
+    if not groups:
+        return prefetched
+
+    try:
+        client = get_client_from_context(ctx)
+    except Exception:
+        # Let the individual operations report the error
+        return prefetched
+
+    for as_of, ids in groups.items():
+        example_ids = list(ids)
+        for start in range(0, len(example_ids), _PREFETCH_EXAMPLES_CHUNK_SIZE):
+            chunk = example_ids[start : start + _PREFETCH_EXAMPLES_CHUNK_SIZE]
+            # Request attachments like client.read_example does, so prefetched results
+            # have the same payload as individual read_example calls
+            result = await asyncio.to_thread(
+                list_examples_tool,
+                client,
+                example_ids=chunk,
+                as_of=as_of,
+                inline_s3_urls=True,
+                include_attachments=True,
+            )
+            for example in result.get("examples", ()):
+                prefetched[(example["id"], as_of)] = {"example": example}
+    return prefetched
 
-    @mcp.tool()
-    def list_prompts(
-        is_public: str = "false", limit: int = 20, ctx: Context = None
-    ) -> Dict[str, Any]:
-        """
-        Fetch prompts from LangSmith with optional filtering.
-
-        Args:
-            is_public (str): Filter by prompt visibility - "true" for public prompts,
-                            "false" for private prompts (default: "false")
-            limit (int): Maximum number of prompts to return (default: 20)
 
-        Returns:
-            Dict[str, Any]: Dictionary containing the prompts and metadata
-        """
-        try:
-            client = get_client_from_context(ctx)
-            is_public_bool = is_public.lower() == "true"
-            return list_prompts_tool(client, is_public_bool, limit)
-        except Exception as e:
-            return {"error": str(e)}
+async def _execute_batch(
+    operations: List[Any], max_concurrent: int, stop_on_error: bool, ctx: Context
+) -> Dict[str, Any]:
+    """
+    Run a list of {"tool": ..., "args": {...}} operations concurrently.
 
-    @mcp.tool()
-    def get_prompt_by_name(prompt_name: str, ctx: Context = None) -> Dict[str, Any]:
-        """
-        Get a specific prompt by its exact name.
+    Each operation is validated against the target tool's signature and executed in a
+    worker thread (async tools are awaited on the event loop), with at most
+    `max_concurrent` operations running at the same time.
+    Results are returned in the same order as the operations. The operations do not
+    report progress, since they would all send it on the batch's progress token.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrent))
+    failed = asyncio.Event()
+    # Only dispatch to tools that are currently registered on the server, so tools
+    # disabled via LANGSMITH_MCP_ENABLED_TOOLS or unregister_tools stay unreachable
+    available = set(_TOOL_REGISTRY)
+    if ctx is not None:
+        available &= set(await ctx.fastmcp.get_tools())
+    # Several read_example operations are served by bulk list_examples requests
+    prefetched = await _prefetch_examples(operations, ctx) if "read_example" in available else {}
+
+    async def run_operation(operation: Any) -> Dict[str, Any]:
+        if not isinstance(operation, dict):
+            failed.set()
+            return {"tool": None, "error": "Each operation must be an object with a 'tool' key"}
+
+        tool_name = operation.get("tool")
+        tool_fn = _TOOL_REGISTRY.get(tool_name) if tool_name in available else None
+        if tool_fn is None:
+            failed.set()
+            return {"tool": tool_name, "error": f"Unknown tool: {tool_name}"}
+
+        args = operation.get("args") or {}
+        if not isinstance(args, dict):
+            failed.set()
+            return {"tool": tool_name, "error": "'args' must be a JSON object"}
+
+        if tool_name == "read_example" and prefetched:
+            example_id, as_of = args.get("example_id"), args.get("as_of")
+            if isinstance(example_id, str) and (as_of is None or isinstance(as_of, str)):
+                example = prefetched.get((example_id, as_of))
+                if example is not None:
+                    return {"tool": tool_name, "result": example}
+
+        async with semaphore:
+            if stop_on_error and failed.is_set():
+                return {"tool": tool_name, "error": "Skipped because an earlier operation failed"}
+            try:
+                type_adapter = get_cached_typeadapter(tool_fn)
+                result = await asyncio.to_thread(type_adapter.validate_python, {**args, "ctx": ctx})
+                if inspect.isawaitable(result):
+                    result = await result
+            except Exception as e:
+                failed.set()
+                return {"tool": tool_name, "error": str(e)}
+
+        if isinstance(result, dict) and "error" in result:
+            failed.set()
+            return {"tool": tool_name, "error": result["error"]}
+        return {"tool": tool_name, "result": result}
+
+    token = _in_batch.set(True)
+    try:
+        results = await asyncio.gather(*(run_operation(operation) for operation in operations))
+    finally:
+        _in_batch.reset(token)
+    return {"results": results}
+
+
+def _langsmith_tool(
+    fn: Optional[Callable[..., Dict[str, Any]]] = None,
+    *,
+    precheck: Optional[Callable[..., Optional[Dict[str, Any]]]] = None,
+) -> Any:
+    """
+    Turn a function taking the LangSmith client as its first argument into a tool.
 
-        Args:
-            prompt_name (str): The exact name of the prompt to retrieve
-            ctx: FastMCP context (automatically provided)
+    The tool resolves the client from the FastMCP context and returns any exception
+    as an error dict. Its signature is the function's without `client`, plus `ctx`,
+    so FastMCP builds the same input schema as for a hand-written wrapper.
 
-        Returns:
-            Dict[str, Any]: Dictionary containing the prompt details and template,
-                          or an error message if the prompt cannot be found
-        """
+    `precheck` is called with the tool arguments before the client is resolved; if it
+    returns an error dict, that is returned without resolving the client. Use
+    `@_langsmith_tool(precheck=...)` to set it.
+    """
+    if fn is None:
+        return functools.partial(_langsmith_tool, precheck=precheck)
+
+    signature = inspect.signature(fn)
+    ctx_parameter = inspect.Parameter(
+        "ctx", inspect.Parameter.KEYWORD_ONLY, default=None, annotation=Context
+    )
+    parameters = [*list(signature.parameters.values())[1:], ctx_parameter]
+
+    @functools.wraps(fn)
+    def tool(*args: Any, ctx: Context = None, **kwargs: Any) -> Dict[str, Any]:
+        if precheck is not None:
+            error = precheck(*args, **kwargs)
+            if error is not None:
+                return error
         try:
-            client = get_client_from_context(ctx)
-            return get_prompt_tool(client, prompt_name=prompt_name)
+            # Inside a server call this is the client LangSmithClientMiddleware resolved
+            return fn(get_client_from_context(ctx), *args, **kwargs)
         except Exception as e:
             return {"error": str(e)}
 
-    @mcp.tool()
-    def push_prompt(ctx: Context = None) -> None:
-        """
-        Documentation tool for understanding how to create and push prompts to LangSmith.
-
-        This tool provides comprehensive documentation on creating ChatPromptTemplate and
-        StructuredPrompt objects and pushing them to LangSmith using the LangSmith Client.
-
-        ---
-        🧩 PURPOSE
-        ----------
-        This is a **documentation-only tool** that explains how to:
-        - Create prompts using LangChain's prompt templates
-        - Push prompts to LangSmith for version control and management
-        - Handle prompt creation vs. version updates
-
-        ---
-        📦 REQUIRED DEPENDENCIES
-        ------------------------
-        To use the functionality described in this documentation, you need:
-        - `langsmith` - The LangSmith Python client
-        - `langchain-core` - Core LangChain functionality for prompt templates
-        - `langchain` (optional) - Required only if using `from langchain.messages` imports
-
-        Install with:
-        ```bash
-        pip install langsmith langchain-core
-        # Optional, for message classes:
-        pip install langchain
-        ```
-
-        ---
-        🔧 HOW TO PUSH PROMPTS
-        -----------------------
-        Use the LangSmith Client's `push_prompt()` method:
-
-        ```python
-        from langsmith import Client
-
-        client = Client()
-
-        url = client.push_prompt(
-            prompt_identifier="my-prompt-name",
-            object=prompt,  # Your prompt object
-            description="Optional description",
-            tags=["tag1", "tag2"],  # Optional tags
-            is_public=False,  # Optional visibility (True/False)
-        )
-        ```
-
-        **Behavior:**
-        - If the prompt name **doesn't exist**: Creates a new prompt in LangSmith
-        - If the prompt name **exists** and it's a **new version**: Creates a new commit/version
-        - If the prompt name **exists** and it's the **same version**: No new commit is created
-
-        ---
-        📝 CREATING CHATPROMPTTEMPLATE PROMPTS
-        --------------------------------------
-
-        1️⃣ **Basic ChatPromptTemplate**
-        ```python
-        from langchain_core.prompts import ChatPromptTemplate
-
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", "You are a helpful AI assistant. Your name is {assistant_name}."),
-            ("human", "{user_input}"),
-        ])
-
-        client.push_prompt("my-chat-prompt", object=prompt)
-        ```
+    tool.__signature__ = signature.replace(parameters=parameters)  # type: ignore[attr-defined]
+    tool.__annotations__ = {
+        **{name: hint for name, hint in fn.__annotations__.items() if name != "client"},
+        "ctx": Context,
+    }
+    return tool
 
-        2️⃣ **Using Message Classes**
-        ```python
-        from langchain_core.prompts import ChatPromptTemplate
-        from langchain.messages import SystemMessage, HumanMessage, AIMessage
 
-        prompt = ChatPromptTemplate.from_messages([
-            SystemMessage(content="You are a coding assistant."),
-            HumanMessage(content="Write a Python function to {task}"),
-            AIMessage(content="I'll help you write that function."),
-            ("human", "Make it {style}"),
-        ])
+def list_prompts(is_public: str = "false", limit: int = 20, ctx: Context = None) -> Dict[str, Any]:
+    """
+    Fetch prompts from LangSmith with optional filtering.
 
-        client.push_prompt("my-message-classes-prompt", object=prompt)
-        ```
+    Args:
+        is_public (str): Filter by prompt visibility - "true" for public prompts,
+                        "false" for private prompts (default: "false")
+        limit (int): Maximum number of prompts to return (default: 20)
 
-        3️⃣ **With MessagesPlaceholder for Conversation History**
-        ```python
-        from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+    Returns:
+        Dict[str, Any]: Dictionary containing the prompts and metadata
+    """
+    try:
+        client = get_client_from_context(ctx)
+        is_public_bool = parse_bool(is_public) is True
+        return list_prompts_tool(client, is_public_bool, limit)
+    except Exception as e:
+        return {"error": str(e)}
 
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", "You are a helpful assistant."),
-            MessagesPlaceholder(variable_name="conversation", optional=True),
-            ("human", "{user_input}"),
-        ])
 
-        client.push_prompt("my-conversation-prompt", object=prompt)
-        ```
+def get_prompt_by_name(prompt_name: str, ctx: Context = None) -> Dict[str, Any]:
+    """
+    Get a specific prompt by its exact name.
 
-        4️⃣ **Complex Prompt with Multiple Placeholders**
-        ```python
-        from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-        from langchain.messages import HumanMessage
-
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", "You are {assistant_name}, a {role} assistant."),
-            MessagesPlaceholder(variable_name="chat_history", optional=True),
-            ("human", "Current question: {question}"),
-            ("ai", "Let me think about that..."),
-            MessagesPlaceholder(variable_name="tool_results", optional=True),
-            HumanMessage(content="Based on the above, what's your final answer?"),
-        ])
-
-        client.push_prompt("my-complex-prompt", object=prompt)
-        ```
+    Args:
+        prompt_name (str): The exact name of the prompt to retrieve
+        ctx: FastMCP context (automatically provided)
 
-        ---
-        🎯 CREATING STRUCTUREDPROMPT PROMPTS
-        ------------------------------------
+    Returns:
+        Dict[str, Any]: Dictionary containing the prompt details and template,
+                      or an error message if the prompt cannot be found
+    """
+    try:
+        client = get_client_from_context(ctx)
+        return get_prompt_tool(client, prompt_name=prompt_name)
+    except Exception as e:
+        return {"error": str(e)}
 
-        StructuredPrompt allows you to define output schemas for structured outputs.
 
-        1️⃣ **With Dictionary Schema (with title and description)**
-        ```python
-        from langchain_core.prompts.structured import StructuredPrompt
-
-        schema = {
-            "title": "SentimentAnalysis",
-            "description": "Analyzes the sentiment of text with confidence and reasoning",
-            "type": "object",
-            "properties": {
-                "sentiment": {
-                    "type": "string",
-                    "enum": ["positive", "negative", "neutral"],
-                    "description": "The sentiment of the text"
-                },
-                "confidence": {
-                    "type": "number",
-                    "description": "Confidence score between 0 and 1"
-                },
-                "reasoning": {
-                    "type": "string",
-                    "description": "Brief reasoning for the sentiment"
-                }
+def push_prompt(ctx: Context = None) -> None:
+    """
+    Documentation tool for understanding how to create and push prompts to LangSmith.
+
+    This tool provides comprehensive documentation on creating ChatPromptTemplate and
+    StructuredPrompt objects and pushing them to LangSmith using the LangSmith Client.
+
+    ---
+    🧩 PURPOSE
+    ----------
+    This is a **documentation-only tool** that explains how to:
+    - Create prompts using LangChain's prompt templates
+    - Push prompts to LangSmith for version control and management
+    - Handle prompt creation vs. version updates
+
+    ---
+    📦 REQUIRED DEPENDENCIES
+    ------------------------
+    To use the functionality described in this documentation, you need:
+    - `langsmith` - The LangSmith Python client
+    - `langchain-core` - Core LangChain functionality for prompt templates
+    - `langchain` (optional) - Required only if using `from langchain.messages` imports
+
+    Install with:
+    ```bash
+    pip install langsmith langchain-core
+    # Optional, for message classes:
+    pip install langchain
+    ```
+
+    ---
+    🔧 HOW TO PUSH PROMPTS
+    -----------------------
+    Use the LangSmith Client's `push_prompt()` method:
+
+    ```python
+    from langsmith import Client
+
+    client = Client()
+
+    url = client.push_prompt(
+        prompt_identifier="my-prompt-name",
+        object=prompt,  # Your prompt object
+        description="Optional description",
+        tags=["tag1", "tag2"],  # Optional tags
+        is_public=False,  # Optional visibility (True/False)
+    )
+    ```
+
+    **Behavior:**
+    - If the prompt name **doesn't exist**: Creates a new prompt in LangSmith
+    - If the prompt name **exists** and it's a **new version**: Creates a new commit/version
+    - If the prompt name **exists** and it's the **same version**: No new commit is created
+
+    ---
+    📝 CREATING CHATPROMPTTEMPLATE PROMPTS
+    --------------------------------------
+
+    1️⃣ **Basic ChatPromptTemplate**
+    ```python
+    from langchain_core.prompts import ChatPromptTemplate
+
+    prompt = ChatPromptTemplate.from_messages([
+        ("system", "You are a helpful AI assistant. Your name is {assistant_name}."),
+        ("human", "{user_input}"),
+    ])
+
+    client.push_prompt("my-chat-prompt", object=prompt)
+    ```
+
+    2️⃣ **Using Message Classes**
+    ```python
+    from langchain_core.prompts import ChatPromptTemplate
+    from langchain.messages import SystemMessage, HumanMessage, AIMessage
+
+    prompt = ChatPromptTemplate.from_messages([
+        SystemMessage(content="You are a coding assistant."),
+        HumanMessage(content="Write a Python function to {task}"),
+        AIMessage(content="I'll help you write that function."),
+        ("human", "Make it {style}"),
+    ])
+
+    client.push_prompt("my-message-classes-prompt", object=prompt)
+    ```
+
+    3️⃣ **With MessagesPlaceholder for Conversation History**
+    ```python
+    from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+
+    prompt = ChatPromptTemplate.from_messages([
+        ("system", "You are a helpful assistant."),
+        MessagesPlaceholder(variable_name="conversation", optional=True),
+        ("human", "{user_input}"),
+    ])
+
+    client.push_prompt("my-conversation-prompt", object=prompt)
+    ```
+
+    4️⃣ **Complex Prompt with Multiple Placeholders**
+    ```python
+    from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+    from langchain.messages import HumanMessage
+
+    prompt = ChatPromptTemplate.from_messages([
+        ("system", "You are {assistant_name}, a {role} assistant."),
+        MessagesPlaceholder(variable_name="chat_history", optional=True),
+        ("human", "Current question: {question}"),
+        ("ai", "Let me think about that..."),
+        MessagesPlaceholder(variable_name="tool_results", optional=True),
+        HumanMessage(content="Based on the above, what's your final answer?"),
+    ])
+
+    client.push_prompt("my-complex-prompt", object=prompt)
+    ```
+
+    ---
+    🎯 CREATING STRUCTUREDPROMPT PROMPTS
+    ------------------------------------
+
+    StructuredPrompt allows you to define output schemas for structured outputs.
+
+    1️⃣ **With Dictionary Schema (with title and description)**
+    ```python
+    from langchain_core.prompts.structured import StructuredPrompt
+
+    schema = {
+        "title": "SentimentAnalysis",
+        "description": "Analyzes the sentiment of text with confidence and reasoning",
+        "type": "object",
+        "properties": {
+            "sentiment": {
+                "type": "string",
+                "enum": ["positive", "negative", "neutral"],
+                "description": "The sentiment of the text"
             },
-            "required": ["sentiment", "confidence", "reasoning"],
-            "strict": True
-        }
-
-        prompt = StructuredPrompt(
-            [
-                ("system", "You are a sentiment analysis expert."),
-                ("human", "Analyze the sentiment of: {text}"),
-            ],
-            schema_=schema,
-        )
+            "confidence": {
+                "type": "number",
+                "description": "Confidence score between 0 and 1"
+            },
+            "reasoning": {
+                "type": "string",
+                "description": "Brief reasoning for the sentiment"
+            }
+        },
+        "required": ["sentiment", "confidence", "reasoning"],
+        "strict": True
+    }
+
+    prompt = StructuredPrompt(
+        [
+            ("system", "You are a sentiment analysis expert."),
+            ("human", "Analyze the sentiment of: {text}"),
+        ],
+        schema_=schema,
+    )
+
+    client.push_prompt("my-structured-prompt", object=prompt)
+    ```
+
+    2️⃣ **With Pydantic Model (Convert to Dict Schema)**
+    ```python
+    from langchain_core.prompts.structured import StructuredPrompt
+    from pydantic import BaseModel, Field
+
+    class UserInfo(BaseModel):
+        '''User information extracted from text.'''
+        name: str = Field(description="The user's name")
+        age: int = Field(description="The user's age")
+        email: str = Field(description="The user's email address")
+
+    # Convert Pydantic model to dict schema
+    schema_dict = UserInfo.model_json_schema()
+    # Add title and description at top level if not present
+    if "title" not in schema_dict:
+        schema_dict["title"] = UserInfo.__name__
+    if "description" not in schema_dict:
+        schema_dict["description"] = UserInfo.__doc__ or f"Schema for {UserInfo.__name__}"
+
+    prompt = StructuredPrompt(
+        [
+            ("system", "You are a helpful assistant that extracts user information."),
+            ("human", "Extract information from: {text}"),
+        ],
+        schema_=schema_dict,
+    )
+
+    client.push_prompt("my-pydantic-prompt", object=prompt)
+    ```
+
+    ---
+    🧠 HELPER FUNCTION PATTERN
+    ---------------------------
+    You can create a reusable helper function:
+
+    ```python
+    def push_prompt_to_langsmith(
+        prompt,
+        prompt_identifier: str,
+        description: str = None,
+        tags: list = None,
+        is_public: bool = None,
+    ) -> str:
+        '''
+        Push a prompt to LangSmith with optional metadata.
 
-        client.push_prompt("my-structured-prompt", object=prompt)
-        ```
+        Args:
+            prompt: The prompt object (ChatPromptTemplate, StructuredPrompt, etc.)
+            prompt_identifier: The name/identifier for the prompt
+            description: Optional description of the prompt
+            tags: Optional list of tags
+            is_public: Optional visibility setting (True/False)
 
-        2️⃣ **With Pydantic Model (Convert to Dict Schema)**
-        ```python
-        from langchain_core.prompts.structured import StructuredPrompt
-        from pydantic import BaseModel, Field
-
-        class UserInfo(BaseModel):
-            '''User information extracted from text.'''
-            name: str = Field(description="The user's name")
-            age: int = Field(description="The user's age")
-            email: str = Field(description="The user's email address")
-
-        # Convert Pydantic model to dict schema
-        schema_dict = UserInfo.model_json_schema()
-        # Add title and description at top level if not present
-        if "title" not in schema_dict:
-            schema_dict["title"] = UserInfo.__name__
-        if "description" not in schema_dict:
-            schema_dict["description"] = UserInfo.__doc__ or f"Schema for {UserInfo.__name__}"
-
-        prompt = StructuredPrompt(
-            [
-                ("system", "You are a helpful assistant that extracts user information."),
-                ("human", "Extract information from: {text}"),
-            ],
-            schema_=schema_dict,
+        Returns:
+            The URL of the pushed prompt
+        '''
+        kwargs = {"object": prompt}
+        if description:
+            kwargs["description"] = description
+        if tags:
+            kwargs["tags"] = tags
+        if is_public is not None:
+            kwargs["is_public"] = is_public
+
+        url = client.push_prompt(prompt_identifier, **kwargs)
+        return url
+    ```
+
+    ---
+    📤 RETURNS
+    ----------
+    None
+        This tool is documentation-only and returns None. The documentation is in the docstring.
+
+    ---
+    🧠 NOTES FOR AGENTS
+    --------------------
+    - This tool is **documentation-only** - it does not execute any code
+    - Use this tool to understand how to create and push prompts programmatically
+    - The `push_prompt()` method automatically handles versioning:
+      - New prompt name → creates new prompt
+      - Existing prompt name with changes → creates new version/commit
+      - Existing prompt name with no changes → no new commit
+    - Always ensure you have the required dependencies installed before using these patterns
+    - Prompt identifiers should be unique and descriptive
+    - Use tags and descriptions to organize and document your prompts
+
+    ---
+    🔐 ENVIRONMENT VARIABLES
+    -------------------------
+    Before using the LangSmith Client, make sure to set up your environment variables:
+
+    **Required:**
+    ```bash
+    export LANGSMITH_API_KEY="lsv2_pt_..."
+    ```
+
+    **Optional:**
+    ```bash
+    # Only needed if using a custom endpoint (defaults to cloud if not set)
+    export LANGSMITH_ENDPOINT="https://api.smith.langchain.com"
+
+    # Only needed if you want to specify a workspace
+    export LANGSMITH_WORKSPACE_ID="35e66a3b-2973-4830-83e1-352c43a660ed"
+    ```
+
+    You can also use a `.env` file with `python-dotenv`:
+    ```python
+    from dotenv import load_dotenv
+    load_dotenv()  # Loads variables from .env file
+
+    from langsmith import Client
+    client = Client()  # Will automatically use environment variables
+    ```
+    """  # noqa: W293
+    return None
+
+
+# Conversation tools
+# def get_thread_history(thread_id: str, project_name: str, ctx: Context = None) -> Dict[str, Any]:
+#     """
+#     Retrieve the message history for a specific conversation thread.
+
+#     Args:
+#         thread_id (str): The unique ID of the thread to fetch history for
+#         project_name (str): The name of the project containing the thread
+#                            (format: "owner/project" or just "project")
+
+#     Returns:
+#         Dict[str, Any]: Dictionary containing the thread history,
+#                             or an error message if the thread cannot be found
+#     """
+#     try:
+#         client = get_client_from_context(ctx)
+#         return get_thread_history_tool(client, thread_id, project_name)
+#     except Exception as e:
+#         return {"error": str(e)}
+
+# Analytics tools
+# def get_project_runs_stats(project_name: str = None, trace_id: str = None, ctx: Context = None) -> Dict[str, Any]:
+#     """
+#     Get statistics about runs in a LangSmith project.
+
+#     Args:
+#         project_name (str): The name of the project to analyze
+#                           (format: "owner/project" or just "project")
+#         trace_id (str): The specific ID of the trace to fetch (preferred parameter)
+
+#     Returns:
+#         Dict[str, Any]: Dictionary containing the requested project run statistics
+#                       or an error message if statistics cannot be retrieved
+#     """
+#     try:
+#         client = get_client_from_context(ctx)
+#         return get_project_runs_stats_tool(client, project_name, trace_id)
+#     except Exception as e:
+#         return {"error": str(e)}
+
+# # Trace tools
+# def fetch_trace(project_name: str = None, trace_id: str = None, ctx: Context = None) -> Dict[str, Any]:
+#     """
+#     Fetch trace content for debugging and analyzing LangSmith runs.
+
+#     Note: Only one parameter (project_name or trace_id) is required.
+#     If both are provided, trace_id is preferred.
+#     String "null" inputs are handled as None values.
+
+#     Args:
+#         project_name (str, optional): The name of the project to fetch the latest trace from
+#         trace_id (str, optional): The specific ID of the trace to fetch (preferred parameter)
+
+#     Returns:
+#         Dict[str, Any]: Dictionary containing the trace data and metadata,
+#                       or an error message if the trace cannot be found
+#     """
+#     try:
+#         client = get_client_from_context(ctx)
+#         return fetch_trace_tool(client, project_name, trace_id)
+#     except Exception as e:
+#         return {"error": str(e)}
+
+
+async def _fetch_runs_pages(
+    client: Any, params: FetchRunsParams, listeners: List["asyncio.Queue[int]"]
+) -> List[Dict[str, Any]]:
+    """Fetch runs page by page off the event loop, publishing the run count after each page."""
+    runs_iter = iter_runs_tool(client, params)
+    runs: List[Dict[str, Any]] = []
+    while True:
+        page = await asyncio.to_thread(list, islice(runs_iter, _RUNS_PAGE_SIZE))
+        if not page:
+            break
+        runs.extend(page)
+        for queue in listeners:
+            queue.put_nowait(len(runs))
+    return runs
+
+
+async def _fetch_runs_deduplicated(
+    client: Any, params: FetchRunsParams, ctx: Optional[Context]
+) -> List[Dict[str, Any]]:
+    """
+    Fetch runs, sharing a single upstream fetch between identical concurrent calls.
+
+    Calls with the same client and parameters that arrive while a fetch is in flight
+    await that fetch instead of starting their own. The entry is dropped as soon as
+    the fetch completes, so completed results are never served from here.
+    The returned list is shared between those callers and must not be mutated.
+    The fetch only publishes its run count to a queue per caller; each caller reports
+    progress on its own context, starting from the first page fetched after it joined.
+    The fetch is cancelled once every caller waiting on it went away.
+    """
+    key = (id(client), json.dumps(astuple(params), sort_keys=True, default=str))
+    entry = _INFLIGHT_RUNS.get(key)
+    if entry is None:
+        listeners: List["asyncio.Queue[int]"] = []
+        task = asyncio.create_task(_fetch_runs_pages(client, params, listeners))
+        _INFLIGHT_RUNS[key] = (task, listeners)
+
+        def _done(finished: "asyncio.Task[List[Dict[str, Any]]]") -> None:
+            _INFLIGHT_RUNS.pop(key, None)
+            # Mark the exception as retrieved if every caller went away
+            if not finished.cancelled():
+                finished.exception()
+
+        task.add_done_callback(_done)
+    else:
+        task, listeners = entry
+
+    queue: "asyncio.Queue[int]" = asyncio.Queue()
+    listeners.append(queue)
+    progress: Optional["asyncio.Task[int]"] = None
+    try:
+        while True:
+            progress = asyncio.ensure_future(queue.get())
+            # Waiting (rather than awaiting the task) means one caller being cancelled
+            # does not cancel the fetch for the others
+            await asyncio.wait({task, progress}, return_when=asyncio.FIRST_COMPLETED)
+            if not progress.done():
+                return task.result()
+            if ctx is not None:
+                await ctx.report_progress(progress=progress.result(), total=params.limit)
+    finally:
+        if progress is not None:
+            progress.cancel()
+        listeners.remove(queue)
+        if not listeners:
+            task.cancel()
+
+
+async def fetch_runs(
+    project_name: str,
+    trace_id: str = None,
+    run_type: str = None,
+    error: str = None,
+    is_root: str = None,
+    filter: str = None,
+    trace_filter: str = None,
+    tree_filter: str = None,
+    order_by: str = "-start_time",
+    limit: int = 50,
+    reference_example_id: str = None,
+    response_format: str = "json",
+    compress: str = None,
+    ctx: Context = None,
+) -> Dict[str, Any]:
+    """
+    Fetch LangSmith runs (traces, tools, chains, etc.) from one or more projects
+    using flexible filters, query language expressions, and trace-level constraints.
+
+    ---
+    🧩 PURPOSE
+    ----------
+    This is a **general-purpose LangSmith run fetcher** designed for analytics,
+    trace export, and automated exploration.
+
+    It wraps `client.list_runs()` with complete support for:
+    - Multiple project names or IDs
+    - The **Filter Query Language (FQL)** for precise queries
+    - Hierarchical filtering across trace trees
+    - Sorting and result limiting
+
+    It returns **raw `dict` objects** suitable for further analysis or export.
+
+    ---
+    ⚙️ PARAMETERS
+    -------------
+    project_name : str
+        The project name to fetch runs from. For multiple projects, use JSON array string (e.g., '["project1", "project2"]').
+
+    trace_id : str, optional
+        Return only runs that belong to a specific trace tree.
+        It is a UUID string, e.g. "123e4567-e89b-12d3-a456-426614174000".
+
+    run_type : str, optional
+        Filter runs by type (e.g. "llm", "chain", "tool", "retriever").
+
+    error : str, optional
+        Filter by error status: "true" for errored runs, "false" for successful runs.
+
+    is_root : str, optional
+        Filter root traces: "true" for only top-level traces, "false" to exclude roots.
+        If not provided, returns all runs.
+
+    filter : str, optional
+        A **Filter Query Language (FQL)** expression that filters runs by fields,
+        metadata, tags, feedback, latency, or time, using comparators such as
+        `eq`, `neq`, `gt`, `lt`, `has`, `search`, `and`, `or`, `not`.
+        Example: 'and(eq(run_type,"llm"), gt(latency,"5s"))'
+
+    trace_filter : str, optional
+        FQL expression applied **to the root run** in each trace tree.
+        Example: 'and(eq(feedback_key,"user_score"), eq(feedback_score,1))'
+
+    tree_filter : str, optional
+        FQL expression applied **to any run** in the trace tree (including siblings or children).
+        Example: 'eq(name,"ExpandQuery")'
+
+    order_by : str, default "-start_time"
+        Sort field; prefix with "-" for descending order.
+
+    limit : int, default 50
+        Maximum number of runs to return.
+
+    reference_example_id : str, optional
+        Filter runs by reference example ID. Returns only runs associated with
+        the specified dataset example ID.
+
+    response_format : str, default "json"
+        Encoding of the returned runs:
+        - `"json"` (default): Returns the runs as regular JSON
+        - `"msgpack"`: Returns `{"_binary_msgpack": "<base64>"}`, a base64-encoded MessagePack
+        blob of the same result. Useful for programmatic clients exporting large traces.
+        Requires the `msgpack` package to be installed on the server.
+
+    compress : str, optional
+        Set to `"zstd"` to return `{"_zstd_b64": "<base64>"}`, a base64-encoded zstd-compressed
+        JSON blob of the result. Trace inputs/outputs compress well, so this greatly reduces
+        payload size for large exports. Only supported with `response_format="json"`.
+
+    ---
+    📤 RETURNS
+    ----------
+    List[dict]
+        A list of LangSmith `dict` objects that satisfy the query.
+
+    ---
+    🧪 EXAMPLES
+    ------------
+    ```python
+    runs = fetch_runs("alpha-project", is_root="true", limit=10)
+    runs = fetch_runs("alpha-project", run_type="tool", error="true")
+    ```
+
+    ---
+    🧠 NOTES FOR AGENTS
+    --------------------
+    - Use this to **query LangSmith data sources dynamically**.
+    - Read the `langsmith://docs/fetch_runs` resource for the full FQL field and comparator
+      reference and more examples (threads, feedback, time ranges).
+    - Compose FQL strings programmatically based on your intent.
+    - Combine `filter`, `trace_filter`, and `tree_filter` for hierarchical logic.
+    - Always verify that `project_name` matches an existing LangSmith project.
+    - Returned `dict` objects have fields like:
+    - `id`, `name`, `run_type`, `inputs`, `outputs`, `error`, `start_time`, `end_time`, `latency`, `metadata`, `feedback`, etc.
+    - If the trace is big, save it to a file (if you have this ability) and analyze it locally.
+    - Progress notifications are sent as runs are fetched, so large requests show progress.
+    """  # noqa: W293
+    try:
+        client = get_client_from_context(ctx)
+
+        raw = {"project_name": project_name, "error": error, "is_root": is_root}
+        parsed = {name: parse(raw[name]) for name, parse in _FETCH_RUNS_PARSE_SPEC}
+
+        if response_format not in ("json", "msgpack"):
+            return {"error": f"Unsupported response_format: {response_format}"}
+        if compress not in (None, "zstd"):
+            return {"error": f"Unsupported compress: {compress}"}
+        if compress and response_format != "json":
+            return {"error": "compress is only supported with response_format 'json'"}
+
+        params = FetchRunsParams(
+            **parsed,
+            trace_id=trace_id,
+            run_type=run_type,
+            filter=filter,
+            trace_filter=trace_filter,
+            tree_filter=tree_filter,
+            order_by=order_by,
+            limit=limit,
+            reference_example_id=reference_example_id,
         )
-
-        client.push_prompt("my-pydantic-prompt", object=prompt)
-        ```
-
-        ---
-        🧠 HELPER FUNCTION PATTERN
-        ---------------------------
-        You can create a reusable helper function:
-
-        ```python
-        def push_prompt_to_langsmith(
-            prompt,
-            prompt_identifier: str,
-            description: str = None,
-            tags: list = None,
-            is_public: bool = None,
-        ) -> str:
-            '''
-            Push a prompt to LangSmith with optional metadata.
-
-            Args:
-                prompt: The prompt object (ChatPromptTemplate, StructuredPrompt, etc.)
-                prompt_identifier: The name/identifier for the prompt
-                description: Optional description of the prompt
-                tags: Optional list of tags
-                is_public: Optional visibility setting (True/False)
-
-            Returns:
-                The URL of the pushed prompt
-            '''
-            kwargs = {"object": prompt}
-            if description:
-                kwargs["description"] = description
-            if tags:
-                kwargs["tags"] = tags
-            if is_public is not None:
-                kwargs["is_public"] = is_public
-
-            url = client.push_prompt(prompt_identifier, **kwargs)
-            return url
-        ```
-
-        ---
-        📤 RETURNS
-        ----------
-        None
-            This tool is documentation-only and returns None. The documentation is in the docstring.
-
-        ---
-        🧠 NOTES FOR AGENTS
-        --------------------
-        - This tool is **documentation-only** - it does not execute any code
-        - Use this tool to understand how to create and push prompts programmatically
-        - The `push_prompt()` method automatically handles versioning:
-          - New prompt name → creates new prompt
-          - Existing prompt name with changes → creates new version/commit
-          - Existing prompt name with no changes → no new commit
-        - Always ensure you have the required dependencies installed before using these patterns
-        - Prompt identifiers should be unique and descriptive
-        - Use tags and descriptions to organize and document your prompts
-
-        ---
-        🔐 ENVIRONMENT VARIABLES
-        -------------------------
-        Before using the LangSmith Client, make sure to set up your environment variables:
-
-        **Required:**
-        ```bash
-        export LANGSMITH_API_KEY="lsv2_pt_..."
-        ```
-
-        **Optional:**
-        ```bash
-        # Only needed if using a custom endpoint (defaults to cloud if not set)
-        export LANGSMITH_ENDPOINT="https://api.smith.langchain.com"
-
-        # Only needed if you want to specify a workspace
-        export LANGSMITH_WORKSPACE_ID="35e66a3b-2973-4830-83e1-352c43a660ed"
-        ```
-
-        You can also use a `.env` file with `python-dotenv`:
-        ```python
-        from dotenv import load_dotenv
-        load_dotenv()  # Loads variables from .env file
-
-        from langsmith import Client
-        client = Client()  # Will automatically use environment variables
-        ```
-        """  # noqa: W293
-        return None
-
-    # Register conversation tools
-    # @mcp.tool()
-    # def get_thread_history(thread_id: str, project_name: str, ctx: Context = None) -> Dict[str, Any]:
-    #     """
-    #     Retrieve the message history for a specific conversation thread.
-
-    #     Args:
-    #         thread_id (str): The unique ID of the thread to fetch history for
-    #         project_name (str): The name of the project containing the thread
-    #                            (format: "owner/project" or just "project")
-
-    #     Returns:
-    #         Dict[str, Any]: Dictionary containing the thread history,
-    #                             or an error message if the thread cannot be found
-    #     """
-    #     try:
-    #         client = get_client_from_context(ctx)
-    #         return get_thread_history_tool(client, thread_id, project_name)
-    #     except Exception as e:
-    #         return {"error": str(e)}
-
-    # Register analytics tools
-    # @mcp.tool()
-    # def get_project_runs_stats(project_name: str = None, trace_id: str = None, ctx: Context = None) -> Dict[str, Any]:
-    #     """
-    #     Get statistics about runs in a LangSmith project.
-
-    #     Args:
-    #         project_name (str): The name of the project to analyze
-    #                           (format: "owner/project" or just "project")
-    #         trace_id (str): The specific ID of the trace to fetch (preferred parameter)
-
-    #     Returns:
-    #         Dict[str, Any]: Dictionary containing the requested project run statistics
-    #                       or an error message if statistics cannot be retrieved
-    #     """
-    #     try:
-    #         client = get_client_from_context(ctx)
-    #         return get_project_runs_stats_tool(client, project_name, trace_id)
-    #     except Exception as e:
-    #         return {"error": str(e)}
-
-    # # Register trace tools
-    # @mcp.tool()
-    # def fetch_trace(project_name: str = None, trace_id: str = None, ctx: Context = None) -> Dict[str, Any]:
-    #     """
-    #     Fetch trace content for debugging and analyzing LangSmith runs.
-
-    #     Note: Only one parameter (project_name or trace_id) is required.
-    #     If both are provided, trace_id is preferred.
-    #     String "null" inputs are handled as None values.
-
-    #     Args:
-    #         project_name (str, optional): The name of the project to fetch the latest trace from
-    #         trace_id (str, optional): The specific ID of the trace to fetch (preferred parameter)
-
-    #     Returns:
-    #         Dict[str, Any]: Dictionary containing the trace data and metadata,
-    #                       or an error message if the trace cannot be found
-    #     """
-    #     try:
-    #         client = get_client_from_context(ctx)
-    #         return fetch_trace_tool(client, project_name, trace_id)
-    #     except Exception as e:
-    #         return {"error": str(e)}
-
-    @mcp.tool()
-    def fetch_runs(
-        project_name: str,
-        trace_id: str = None,
-        run_type: str = None,
-        error: str = None,
-        is_root: str = None,
-        filter: str = None,
-        trace_filter: str = None,
-        tree_filter: str = None,
-        order_by: str = "-start_time",
-        limit: int = 50,
-        reference_example_id: str = None,
-        ctx: Context = None,
-    ) -> Dict[str, Any]:
-        """
-        Fetch LangSmith runs (traces, tools, chains, etc.) from one or more projects
-        using flexible filters, query language expressions, and trace-level constraints.
-
-        ---
-        🧩 PURPOSE
-        ----------
-        This is a **general-purpose LangSmith run fetcher** designed for analytics,
-        trace export, and automated exploration.
-
-        It wraps `client.list_runs()` with complete support for:
-        - Multiple project names or IDs
-        - The **Filter Query Language (FQL)** for precise queries
-        - Hierarchical filtering across trace trees
-        - Sorting and result limiting
-
-        It returns **raw `dict` objects** suitable for further analysis or export.
-
-        ---
-        ⚙️ PARAMETERS
-        -------------
-        project_name : str
-            The project name to fetch runs from. For multiple projects, use JSON array string (e.g., '["project1", "project2"]').
-
-        trace_id : str, optional
-            Return only runs that belong to a specific trace tree.
-            It is a UUID string, e.g. "123e4567-e89b-12d3-a456-426614174000".
-
-        run_type : str, optional
-            Filter runs by type (e.g. "llm", "chain", "tool", "retriever").
-
-        error : str, optional
-            Filter by error status: "true" for errored runs, "false" for successful runs.
-
-        is_root : str, optional
-            Filter root traces: "true" for only top-level traces, "false" to exclude roots.
-            If not provided, returns all runs.
-
-        filter : str, optional
-            A **Filter Query Language (FQL)** expression that filters runs by fields,
-            metadata, tags, feedback, latency, or time.
-
-            ─── Common field names ───
-            - `id`, `name`, `run_type`
-            - `start_time`, `end_time`
-            - `latency`
-            - `total_tokens`
-            - `error`
-            - `tags`
-            - `feedback_key`, `feedback_score`
-            - `metadata_key`, `metadata_value`
-            - `execution_order`
-
-            ─── Supported comparators ───
-            - `eq`, `neq` → equal / not equal
-            - `gt`, `gte`, `lt`, `lte` → numeric or time comparisons
-            - `has` → tag or metadata contains value
-            - `search` → substring or full-text match
-            - `and`, `or`, `not` → logical operators
-
-            ─── Examples ───
-            ```python
-            'gt(latency, "5s")'                                # took longer than 5 seconds
-            'neq(error, null)'                                  # errored runs
-            'has(tags, "beta")'                                 # runs tagged "beta"
-            'and(eq(name,"ChatOpenAI"), eq(run_type,"llm"))'    # named & typed runs
-            'search("image classification")'                    # full-text search
-            ```
-
-        trace_filter : str, optional
-            Filter applied **to the root run** in each trace tree.
-            Lets you select child runs based on root attributes or feedback.
-
-            Example:
-            ```python
-            'and(eq(feedback_key,"user_score"), eq(feedback_score,1))'
-            ```
-            → return runs whose root trace has a user_score of 1.
-
-        tree_filter : str, optional
-            Filter applied **to any run** in the trace tree (including siblings or children).
-            Example:
-            ```python
-            'eq(name,"ExpandQuery")'
-            ```
-            → return runs if *any* run in their trace had that name.
-
-        order_by : str, default "-start_time"
-            Sort field; prefix with "-" for descending order.
-
-        limit : int, default 50
-            Maximum number of runs to return.
-
-        reference_example_id : str, optional
-            Filter runs by reference example ID. Returns only runs associated with
-            the specified dataset example ID.
-
-        ---
-        📤 RETURNS
-        ----------
-        List[dict]
-            A list of LangSmith `dict` objects that satisfy the query.
-
-        ---
-        🧪 EXAMPLES
-        ------------
-        1️⃣ **Get latest 10 root runs**
-        ```python
-        runs = fetch_runs("alpha-project", is_root="true", limit=10)
-        ```
-
-        2️⃣ **Get all tool runs that errored**
-        ```python
-        runs = fetch_runs("alpha-project", run_type="tool", error="true")
-        ```
-
-        3️⃣ **Get all runs that took >5s and have tag "experimental"**
-        ```python
-        runs = fetch_runs("alpha-project", filter='and(gt(latency,"5s"), has(tags,"experimental"))')
-        ```
-
-        4️⃣ **Get all runs in a specific conversation thread**
+        # Inside batch_execute several fetches would share one progress token
+        progress_ctx = None if _in_batch.get() else ctx
+        runs = await _fetch_runs_deduplicated(client, params, progress_ctx)
+
+        result = {"runs": runs}
+        if compress == "zstd":
+            return await asyncio.to_thread(pack_zstd_response, result)
+        if response_format == "msgpack":
+            return await asyncio.to_thread(pack_msgpack_response, result)
+        return result
+    except Exception as e:
+        return {"error": str(e)}
+
+
+# Project tools
+def list_projects(
+    limit: int = 5,
+    project_name: str = None,
+    more_info: str = "false",
+    reference_dataset_id: str = None,
+    reference_dataset_name: str = None,
+    ctx: Context = None,
+) -> Dict[str, Any]:
+    """
+    List LangSmith projects with optional filtering and detail level control.
+
+    Fetches projects from LangSmith, optionally filtering by name and controlling
+    the level of detail returned. Can return either simplified project information
+    or full project details.
+    In case a dataset id or name is provided, you don't need to provide a project name.
+
+    ---
+    🧩 PURPOSE
+    ----------
+    This function provides a convenient way to list and explore LangSmith projects.
+    It supports:
+    - Filtering projects by name (partial match)
+    - Limiting the number of results
+    - Choosing between simplified or full project information
+    - Automatically extracting deployment IDs from nested project data
+
+    ---
+    ⚙️ PARAMETERS
+    -------------
+    limit : int, default 5
+        Maximum number of projects to return (as string, e.g., "5"). This can be adjusted by agents
+        or users based on their needs.
+
+    project_name : str, optional
+        Filter projects by name using partial matching. If provided, only projects
+        whose names contain this string will be returned.
+        Example: `project_name="Chat"` will match "Chat-LangChain", "ChatBot", etc.
+
+    more_info : str, default "false"
+        Controls the level of detail returned:
+        - `"false"` (default): Returns simplified project information with only
+        essential fields: `name`, `project_id`, and `agent_deployment_id` (if available)
+        - `"true"`: Returns full project details as returned by the LangSmith API
+
+    reference_dataset_id : str, optional
+        The ID of the reference dataset to filter projects by.
+        Either this OR `reference_dataset_name` must be provided (but not both).
+
+    reference_dataset_name : str, optional
+        The name of the reference dataset to filter projects by.
+        Either this OR `reference_dataset_id` must be provided (but not both).
+
+    ---
+    📤 RETURNS
+    ----------
+    List[dict]
+        A list of project dictionaries. The structure depends on `more_info`:
+
+        **When `more_info=False` (simplified):**
         ```python
-        thread_id = "abc-123"
-        fql = f'and(in(metadata_key, ["session_id","conversation_id","thread_id"]), eq(metadata_value, "{thread_id}"))'
-        runs = fetch_runs("alpha-project", is_root="true", filter=fql)
+        [
+            {
+                "name": "Chat-LangChain",
+                "project_id": "787d5165-f110-43ff-a3fb-66ea1a70c971",
+                "agent_deployment_id": "deployment-123"  # Only if available
+            },
+            ...
+        ]
         ```
 
-        5️⃣ **List all runs called "extractor" whose root trace has feedback user_score=1**
-        ```python
-        runs = fetch_runs(
-            "alpha-project",
-            filter='eq(name,"extractor")',
-            trace_filter='and(eq(feedback_key,"user_score"), eq(feedback_score,1))'
+        **When `more_info=True` (full details):**
+        Returns complete project objects with all fields from the LangSmith API,
+        including metadata, settings, statistics, and nested structures.
+
+    ---
+    🧪 EXAMPLES
+    ------------
+    1️⃣ **List first 5 projects (simplified)**
+    ```python
+    projects = list_projects(limit="5")
+    ```
+
+    2️⃣ **Search for projects with "Chat" in the name**
+    ```python
+    projects = list_projects(project_name="Chat", limit="10")
+    ```
+
+    3️⃣ **Get full project details**
+    ```python
+    projects = list_projects(limit="3", more_info="true")
+    ```
+
+    4️⃣ **Find a specific project with full details**
+    ```python
+    projects = list_projects(project_name="MyProject", more_info="true", limit="1")
+    ```
+
+    ---
+    🧠 NOTES FOR AGENTS
+    --------------------
+    - Use `more_info="false"` for quick project discovery and listing
+    - Use `more_info="true"` when you need detailed project information
+    - The `agent_deployment_id` field is automatically extracted from nested
+    project data when available, making it easy to identify agent deployments
+    - Projects are filtered to exclude reference projects by default
+    - The function uses `name_contains` for filtering, so partial matches work
+    """  # noqa: W293
+    try:
+        client = get_client_from_context(ctx)
+        parsed_more_info = parse_bool(more_info) is True
+        if reference_dataset_id is not None and reference_dataset_name is not None:
+            parsed_more_info = True
+        return list_projects_tool(
+            client,
+            limit=limit,
+            project_name=project_name,
+            more_info=parsed_more_info,
+            reference_dataset_id=reference_dataset_id,
+            reference_dataset_name=reference_dataset_name,
         )
-        ```
+    except Exception as e:
+        return {"error": str(e)}
 
-        6️⃣ **List all runs that started after a timestamp and either errored or got low feedback**
-        ```python
-        fql = 'and(gt(start_time,"2023-07-15T12:34:56Z"), or(neq(error,null), and(eq(feedback_key,"Correctness"), eq(feedback_score,0.0))))'
-        runs = fetch_runs("alpha-project", filter=fql)
-        ```
 
-        ---
-        🧠 NOTES FOR AGENTS
-        --------------------
-        - Use this to **query LangSmith data sources dynamically**.
-        - Compose FQL strings programmatically based on your intent.
-        - Combine `filter`, `trace_filter`, and `tree_filter` for hierarchical logic.
-        - Always verify that `project_name` matches an existing LangSmith project.
-        - Returned `dict` objects have fields like:
-        - `id`, `name`, `run_type`, `inputs`, `outputs`, `error`, `start_time`, `end_time`, `latency`, `metadata`, `feedback`, etc.
-        - If the trace is big, save it to a file (if you have this ability) and analyze it locally.
-        """  # noqa: W293
-        try:
-            client = get_client_from_context(ctx)
-
-            # Parse project_name - can be a single string or JSON array
-            parsed_project_name = project_name
-            if project_name and project_name.startswith("["):
-                try:
-                    parsed_project_name = json.loads(project_name)
-                except json.JSONDecodeError:
-                    pass  # Use as-is if not valid JSON
-
-            # Parse boolean strings
-            parsed_error = None
-            if error is not None:
-                parsed_error = (
-                    error.lower() == "true" if error.lower() in ("true", "false") else None
-                )
-
-            parsed_is_root = None
-            if is_root is not None:
-                if is_root.lower() == "true":
-                    parsed_is_root = True
-                elif is_root.lower() == "false":
-                    parsed_is_root = False
-
-            return fetch_runs_tool(
-                client,
-                project_name=parsed_project_name,
-                trace_id=trace_id,
-                run_type=run_type,
-                error=parsed_error,
-                is_root=parsed_is_root,
-                filter=filter,
-                trace_filter=trace_filter,
-                tree_filter=tree_filter,
-                order_by=order_by,
-                limit=limit,
-                reference_example_id=reference_example_id,
-            )
-        except Exception as e:
-            return {"error": str(e)}
+def list_experiments(
+    reference_dataset_id: Optional[str] = None,
+    reference_dataset_name: Optional[str] = None,
+    limit: int = 5,
+    project_name: Optional[str] = None,
+    ctx: Context = None,
+) -> Dict[str, Any]:
+    """
+    List LangSmith experiment projects (reference projects) with mandatory dataset filtering.
+
+    Fetches experiment projects from LangSmith that are associated with a specific dataset.
+    These are projects used for model evaluation and comparison. Requires either a
+    dataset ID or dataset name to filter experiments.
+
+    ---
+    🧩 PURPOSE
+    ----------
+    This function provides a convenient way to list and explore LangSmith experiment projects.
+    It supports:
+    - Filtering experiments by reference dataset (mandatory)
+    - Filtering projects by name (partial match)
+    - Limiting the number of results
+    - Automatically extracting deployment IDs from nested project data
+    - Returns simplified project information with key metrics (latency, cost, feedback stats)
+
+    ---
+    ⚙️ PARAMETERS
+    -------------
+    reference_dataset_id : str, optional
+        The ID of the reference dataset to filter experiments by.
+        Either this OR `reference_dataset_name` must be provided (but not both).
+
+    reference_dataset_name : str, optional
+        The name of the reference dataset to filter experiments by.
+        Either this OR `reference_dataset_id` must be provided (but not both).
+
+    limit : int, default 5
+        Maximum number of experiments to return. This can be adjusted by agents
+        or users based on their needs.
+
+    project_name : str, optional
+        Filter projects by name using partial matching. If provided, only projects
+        whose names contain this string will be returned.
+        Example: `project_name="Chat"` will match "Chat-LangChain", "ChatBot", etc.
+
+    ---
+    📤 RETURNS
+    ----------
+    Dict[str, Any]
+        A dictionary containing an "experiments" key with a list of simplified experiment project dictionaries:
 
-    # Register project tools
-    @mcp.tool()
-    def list_projects(
-        limit: int = 5,
-        project_name: str = None,
-        more_info: str = "false",
-        reference_dataset_id: str = None,
-        reference_dataset_name: str = None,
-        ctx: Context = None,
-    ) -> Dict[str, Any]:
-        """
-        List LangSmith projects with optional filtering and detail level control.
-
-        Fetches projects from LangSmith, optionally filtering by name and controlling
-        the level of detail returned. Can return either simplified project information
-        or full project details.
-        In case a dataset id or name is provided, you don't need to provide a project name.
-
-        ---
-        🧩 PURPOSE
-        ----------
-        This function provides a convenient way to list and explore LangSmith projects.
-        It supports:
-        - Filtering projects by name (partial match)
-        - Limiting the number of results
-        - Choosing between simplified or full project information
-        - Automatically extracting deployment IDs from nested project data
-
-        ---
-        ⚙️ PARAMETERS
-        -------------
-        limit : int, default 5
-            Maximum number of projects to return (as string, e.g., "5"). This can be adjusted by agents
-            or users based on their needs.
-
-        project_name : str, optional
-            Filter projects by name using partial matching. If provided, only projects
-            whose names contain this string will be returned.
-            Example: `project_name="Chat"` will match "Chat-LangChain", "ChatBot", etc.
-
-        more_info : str, default "false"
-            Controls the level of detail returned:
-            - `"false"` (default): Returns simplified project information with only
-            essential fields: `name`, `project_id`, and `agent_deployment_id` (if available)
-            - `"true"`: Returns full project details as returned by the LangSmith API
-
-        reference_dataset_id : str, optional
-            The ID of the reference dataset to filter projects by.
-            Either this OR `reference_dataset_name` must be provided (but not both).
-
-        reference_dataset_name : str, optional
-            The name of the reference dataset to filter projects by.
-            Either this OR `reference_dataset_id` must be provided (but not both).
-
-        ---
-        📤 RETURNS
-        ----------
-        List[dict]
-            A list of project dictionaries. The structure depends on `more_info`:
-
-            **When `more_info=False` (simplified):**
-            ```python
-            [
+        ```python
+        {
+            "experiments": [
                 {
-                    "name": "Chat-LangChain",
-                    "project_id": "787d5165-f110-43ff-a3fb-66ea1a70c971",
+                    "name": "Experiment-Chat-LangChain",
+                    "experiment_id": "787d5165-f110-43ff-a3fb-66ea1a70c971",
+                    "feedback_stats": {...},  # Feedback statistics if available
+                    "latency_p50_seconds": 1.626,  # 50th percentile latency in seconds
+                    "latency_p99_seconds": 2.390,   # 99th percentile latency in seconds
+                    "total_cost": 0.00013005,       # Total cost in dollars
+                    "prompt_cost": 0.00002085,      # Prompt cost in dollars
+                    "completion_cost": 0.0001092,   # Completion cost in dollars
                     "agent_deployment_id": "deployment-123"  # Only if available
                 },
                 ...
             ]
-            ```
-
-            **When `more_info=True` (full details):**
-            Returns complete project objects with all fields from the LangSmith API,
-            including metadata, settings, statistics, and nested structures.
-
-        ---
-        🧪 EXAMPLES
-        ------------
-        1️⃣ **List first 5 projects (simplified)**
-        ```python
-        projects = list_projects(limit="5")
+        }
         ```
 
-        2️⃣ **Search for projects with "Chat" in the name**
-        ```python
-        projects = list_projects(project_name="Chat", limit="10")
-        ```
+    ---
+    🧪 EXAMPLES
+    ------------
+    1️⃣ **List experiments for a dataset by ID**
+    ```python
+    experiments = list_experiments(reference_dataset_id="f5ca13c6-96ad-48ba-a432-ebb6bf94528f")
+    ```
+
+    2️⃣ **List experiments for a dataset by name**
+    ```python
+    experiments = list_experiments(reference_dataset_name="my-dataset", limit=10)
+    ```
+
+    3️⃣ **Find experiments with specific name pattern**
+    ```python
+    experiments = list_experiments(
+        reference_dataset_id="f5ca13c6-96ad-48ba-a432-ebb6bf94528f",
+        project_name="Chat",
+        limit=1
+    )
+    ```
+
+    ---
+    🧠 NOTES FOR AGENTS
+    --------------------
+    - Returns simplified experiment information with key metrics (latency, cost, feedback stats)
+    - The `agent_deployment_id` field is automatically extracted from nested
+      project data when available, making it easy to identify agent deployments
+    - Experiments are filtered to include only reference projects (associated with datasets)
+    - The function uses `name_contains` for filtering, so partial matches work
+    - You must provide either `reference_dataset_id` OR `reference_dataset_name`, but not both
+    - Experiment projects are used for model evaluation and comparison across different runs
+    """  # noqa: W293
+    try:
+        client = get_client_from_context(ctx)
+        return list_experiments_tool(
+            client,
+            reference_dataset_id=reference_dataset_id,
+            reference_dataset_name=reference_dataset_name,
+            limit=limit,
+            project_name=project_name,
+        )
+    except Exception as e:
+        return {"error": str(e)}
 
-        3️⃣ **Get full project details**
-        ```python
-        projects = list_projects(limit="3", more_info="true")
-        ```
 
-        4️⃣ **Find a specific project with full details**
-        ```python
-        projects = list_projects(project_name="MyProject", more_info="true", limit="1")
-        ```
+def _is_fixed_as_of(as_of: Optional[str]) -> bool:
+    """
+    Check whether as_of is an ISO timestamp in the past.
 
-        ---
-        🧠 NOTES FOR AGENTS
-        --------------------
-        - Use `more_info="false"` for quick project discovery and listing
-        - Use `more_info="true"` when you need detailed project information
-        - The `agent_deployment_id` field is automatically extracted from nested
-        project data when available, making it easy to identify agent deployments
-        - Projects are filtered to exclude reference projects by default
-        - The function uses `name_contains` for filtering, so partial matches work
-        """  # noqa: W293
-        try:
-            client = get_client_from_context(ctx)
-            parsed_more_info = more_info.lower() == "true"
-            if reference_dataset_id is not None and reference_dataset_name is not None:
-                parsed_more_info = True
-            return list_projects_tool(
-                client,
-                limit=limit,
-                project_name=project_name,
-                more_info=parsed_more_info,
-                reference_dataset_id=reference_dataset_id,
-                reference_dataset_name=reference_dataset_name,
-            )
-        except Exception as e:
-            return {"error": str(e)}
+    Such a timestamp pins the dataset state, so results read with it never change.
+    Version tags (e.g. "latest") can be moved and are not considered fixed.
+    """
+    if not as_of:
+        return False
+    parsed = _parse_as_of_parameter(as_of)
+    if not isinstance(parsed, datetime):
+        return False
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed <= datetime.now(timezone.utc)
+
+
+def _read_example_single_flight(
+    client: Any, example_id: str, as_of: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Read an example, sharing one API request between identical concurrent calls.
 
-    @mcp.tool()
-    def list_experiments(
-        reference_dataset_id: Optional[str] = None,
-        reference_dataset_name: Optional[str] = None,
-        limit: int = 5,
-        project_name: Optional[str] = None,
-        ctx: Context = None,
-    ) -> Dict[str, Any]:
-        """
-        List LangSmith experiment projects (reference projects) with mandatory dataset filtering.
-
-        Fetches experiment projects from LangSmith that are associated with a specific dataset.
-        These are projects used for model evaluation and comparison. Requires either a
-        dataset ID or dataset name to filter experiments.
-
-        ---
-        🧩 PURPOSE
-        ----------
-        This function provides a convenient way to list and explore LangSmith experiment projects.
-        It supports:
-        - Filtering experiments by reference dataset (mandatory)
-        - Filtering projects by name (partial match)
-        - Limiting the number of results
-        - Automatically extracting deployment IDs from nested project data
-        - Returns simplified project information with key metrics (latency, cost, feedback stats)
-
-        ---
-        ⚙️ PARAMETERS
-        -------------
-        reference_dataset_id : str, optional
-            The ID of the reference dataset to filter experiments by.
-            Either this OR `reference_dataset_name` must be provided (but not both).
-
-        reference_dataset_name : str, optional
-            The name of the reference dataset to filter experiments by.
-            Either this OR `reference_dataset_id` must be provided (but not both).
-
-        limit : int, default 5
-            Maximum number of experiments to return. This can be adjusted by agents
-            or users based on their needs.
-
-        project_name : str, optional
-            Filter projects by name using partial matching. If provided, only projects
-            whose names contain this string will be returned.
-            Example: `project_name="Chat"` will match "Chat-LangChain", "ChatBot", etc.
-
-        ---
-        📤 RETURNS
-        ----------
-        Dict[str, Any]
-            A dictionary containing an "experiments" key with a list of simplified experiment project dictionaries:
-
-            ```python
-            {
-                "experiments": [
-                    {
-                        "name": "Experiment-Chat-LangChain",
-                        "experiment_id": "787d5165-f110-43ff-a3fb-66ea1a70c971",
-                        "feedback_stats": {...},  # Feedback statistics if available
-                        "latency_p50_seconds": 1.626,  # 50th percentile latency in seconds
-                        "latency_p99_seconds": 2.390,   # 99th percentile latency in seconds
-                        "total_cost": 0.00013005,       # Total cost in dollars
-                        "prompt_cost": 0.00002085,      # Prompt cost in dollars
-                        "completion_cost": 0.0001092,   # Completion cost in dollars
-                        "agent_deployment_id": "deployment-123"  # Only if available
-                    },
-                    ...
-                ]
-            }
-            ```
+    Calls for the same client, example and as_of that arrive while a request is in
+    flight (e.g. from batch_execute worker threads) wait for its result instead of
+    sending their own. The returned dict is shared and must not be mutated.
+    """
+    key = (id(client), example_id, as_of)
+    with _INFLIGHT_EXAMPLES_LOCK:
+        future = _INFLIGHT_EXAMPLES.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = _INFLIGHT_EXAMPLES[key] = Future()
+    if not is_leader:
+        return future.result()
+
+    try:
+        result = read_example_tool(client, example_id=example_id, as_of=as_of)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+    finally:
+        with _INFLIGHT_EXAMPLES_LOCK:
+            del _INFLIGHT_EXAMPLES[key]
+    return result
+
+
+def _read_example_cached(client: Any, example_id: str, as_of: str) -> Dict[str, Any]:
+    """
+    Read an example through the example cache of the client's configuration.
 
-        ---
-        🧪 EXAMPLES
-        ------------
-        1️⃣ **List experiments for a dataset by ID**
-        ```python
-        experiments = list_experiments(reference_dataset_id="f5ca13c6-96ad-48ba-a432-ebb6bf94528f")
-        ```
+    Only successful results are cached; errors are returned without being stored.
+    """
+    key = (example_id, as_of)
+    config = client_config_key(client)
+    with _EXAMPLE_CACHE_LOCK:
+        cache = _EXAMPLE_CACHE.get(config)
+        if cache is None:
+            cache = _EXAMPLE_CACHE[config] = OrderedDict()
+            if len(_EXAMPLE_CACHE) > _EXAMPLE_CACHE_CONFIGS:
+                _EXAMPLE_CACHE.popitem(last=False)
+        _EXAMPLE_CACHE.move_to_end(config)
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+            return cached
+
+    result = _read_example_single_flight(client, example_id, as_of)
+    if "error" not in result:
+        with _EXAMPLE_CACHE_LOCK:
+            cache[key] = result
+            cache.move_to_end(key)
+            if len(cache) > _EXAMPLE_CACHE_SIZE:
+                cache.popitem(last=False)
+    return result
+
+
+# Dataset tools
+def list_datasets(
+    dataset_ids: Optional[str] = None,
+    data_type: Optional[str] = None,
+    dataset_name: Optional[str] = None,
+    dataset_name_contains: Optional[str] = None,
+    metadata: Optional[Union[str, Dict[str, Any]]] = None,
+    limit: int = 20,
+    ctx: Context = None,
+) -> Dict[str, Any]:
+    """
+    Fetch LangSmith datasets.
 
-        2️⃣ **List experiments for a dataset by name**
-        ```python
-        experiments = list_experiments(reference_dataset_name="my-dataset", limit=10)
-        ```
+    Note: If no arguments are provided, all datasets will be returned.
 
-        3️⃣ **Find experiments with specific name pattern**
-        ```python
-        experiments = list_experiments(
-            reference_dataset_id="f5ca13c6-96ad-48ba-a432-ebb6bf94528f",
-            project_name="Chat",
-            limit=1
+    Args:
+        dataset_ids (Optional[str]): Dataset IDs to filter by as JSON array string (e.g., '["id1", "id2"]') or single ID
+        data_type (Optional[str]): Filter by dataset data type (e.g., 'chat', 'kv')
+        dataset_name (Optional[str]): Filter by exact dataset name
+        dataset_name_contains (Optional[str]): Filter by substring in dataset name
+        metadata (Optional[Union[str, Dict[str, Any]]]): Filter by metadata as an object or a JSON object string (e.g., '{"key": "value"}')
+        limit (int): Max number of datasets to return (default: 20)
+        ctx: FastMCP context (automatically provided)
+
+    Returns:
+        Dict[str, Any]: Dictionary containing the datasets and metadata,
+                        or an error message if the datasets cannot be retrieved
+    """  # noqa: W293
+    try:
+        client = get_client_from_context(ctx)
+
+        # Parse list strings (JSON arrays) and metadata (JSON object)
+        parsed_dataset_ids = parse_json_array(dataset_ids)
+        parsed_metadata = parse_json_obj(metadata)
+
+        return list_datasets_tool(
+            client,
+            dataset_ids=parsed_dataset_ids,
+            data_type=data_type,
+            dataset_name=dataset_name,
+            dataset_name_contains=dataset_name_contains,
+            metadata=parsed_metadata,
+            limit=limit,
         )
-        ```
-
-        ---
-        🧠 NOTES FOR AGENTS
-        --------------------
-        - Returns simplified experiment information with key metrics (latency, cost, feedback stats)
-        - The `agent_deployment_id` field is automatically extracted from nested
-          project data when available, making it easy to identify agent deployments
-        - Experiments are filtered to include only reference projects (associated with datasets)
-        - The function uses `name_contains` for filtering, so partial matches work
-        - You must provide either `reference_dataset_id` OR `reference_dataset_name`, but not both
-        - Experiment projects are used for model evaluation and comparison across different runs
-        """  # noqa: W293
-        try:
-            client = get_client_from_context(ctx)
-            return list_experiments_tool(
-                client,
-                reference_dataset_id=reference_dataset_id,
-                reference_dataset_name=reference_dataset_name,
-                limit=limit,
-                project_name=project_name,
-            )
-        except Exception as e:
-            return {"error": str(e)}
-
-    # Register dataset tools
-    @mcp.tool()
-    def list_datasets(
-        dataset_ids: Optional[str] = None,
-        data_type: Optional[str] = None,
-        dataset_name: Optional[str] = None,
-        dataset_name_contains: Optional[str] = None,
-        metadata: Optional[str] = None,
-        limit: int = 20,
-        ctx: Context = None,
-    ) -> Dict[str, Any]:
-        """
-        Fetch LangSmith datasets.
-
-        Note: If no arguments are provided, all datasets will be returned.
-
-        Args:
-            dataset_ids (Optional[str]): Dataset IDs to filter by as JSON array string (e.g., '["id1", "id2"]') or single ID
-            data_type (Optional[str]): Filter by dataset data type (e.g., 'chat', 'kv')
-            dataset_name (Optional[str]): Filter by exact dataset name
-            dataset_name_contains (Optional[str]): Filter by substring in dataset name
-            metadata (Optional[str]): Filter by metadata as JSON object string (e.g., '{"key": "value"}')
-            limit (int): Max number of datasets to return (default: 20)
-            ctx: FastMCP context (automatically provided)
-
-        Returns:
-            Dict[str, Any]: Dictionary containing the datasets and metadata,
-                            or an error message if the datasets cannot be retrieved
-        """  # noqa: W293
-        try:
-            client = get_client_from_context(ctx)
-
-            # Parse list strings (JSON arrays)
-            parsed_dataset_ids = None
-            if dataset_ids is not None:
-                try:
-                    parsed_dataset_ids = (
-                        json.loads(dataset_ids) if dataset_ids.startswith("[") else [dataset_ids]
-                    )
-                except (json.JSONDecodeError, AttributeError):
-                    parsed_dataset_ids = [dataset_ids] if dataset_ids else None
-
-            # Parse metadata (JSON object)
-            parsed_metadata = None
-            if metadata is not None:
-                try:
-                    parsed_metadata = json.loads(metadata) if metadata.startswith("{") else None
-                except (json.JSONDecodeError, AttributeError):
-                    parsed_metadata = None
-
-            return list_datasets_tool(
-                client,
-                dataset_ids=parsed_dataset_ids,
-                data_type=data_type,
-                dataset_name=dataset_name,
-                dataset_name_contains=dataset_name_contains,
-                metadata=parsed_metadata,
-                limit=limit,
-            )
-        except Exception as e:
-            return {"error": str(e)}
-
-    @mcp.tool()
-    def list_examples(
-        dataset_id: Optional[str] = None,
-        dataset_name: Optional[str] = None,
-        example_ids: Optional[str] = None,
-        filter: Optional[str] = None,
-        metadata: Optional[str] = None,
-        splits: Optional[str] = None,
-        inline_s3_urls: Optional[str] = None,
-        include_attachments: Optional[str] = None,
-        as_of: Optional[str] = None,
-        limit: int = 10,
-        offset: Optional[str] = None,
-        ctx: Context = None,
-    ) -> Dict[str, Any]:
-        """
-        Fetch examples from a LangSmith dataset with advanced filtering options.
-
-        Note: Either dataset_id, dataset_name, or example_ids must be provided.
-        If multiple are provided, they are used in order of precedence: example_ids, dataset_id, dataset_name.
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def list_examples(
+    dataset_id: Optional[str] = None,
+    dataset_name: Optional[str] = None,
+    example_ids: Optional[Union[List[str], str]] = None,
+    filter: Optional[str] = None,
+    metadata: Optional[Union[str, Dict[str, Any]]] = None,
+    splits: Optional[Union[List[str], str]] = None,
+    inline_s3_urls: Optional[str] = None,
+    include_attachments: Optional[str] = None,
+    as_of: Optional[str] = None,
+    limit: Optional[int] = 10,
+    offset: Optional[int] = None,
+    ctx: Context = None,
+) -> Dict[str, Any]:
+    """
+    Fetch examples from a LangSmith dataset with advanced filtering options.
 
-        Args:
-            dataset_id (Optional[str]): Dataset ID to retrieve examples from
-            dataset_name (Optional[str]): Dataset name to retrieve examples from
-            example_ids (Optional[str]): Specific example IDs as JSON array string (e.g., '["id1", "id2"]') or single ID
-            limit (int): Maximum number of examples to return (default: 10)
-            offset (int): Number of examples to skip (default: 0)
-            filter (Optional[str]): Filter string using LangSmith query syntax (e.g., 'has(metadata, {"key": "value"})')
-            metadata (Optional[str]): Metadata to filter by as JSON object string (e.g., '{"key": "value"}')
-            splits (Optional[str]): Dataset splits as JSON array string (e.g., '["train", "test"]') or single split
-            inline_s3_urls (Optional[str]): Whether to inline S3 URLs: "true" or "false" (default: SDK default if not specified)
-            include_attachments (Optional[str]): Whether to include attachments: "true" or "false" (default: SDK default if not specified)
-            as_of (Optional[str]): Dataset version tag OR ISO timestamp to retrieve examples as of that version/time
-            ctx: FastMCP context (automatically provided)
-
-        Returns:
-            Dict[str, Any]: Dictionary containing the examples and metadata,
-                            or an error message if the examples cannot be retrieved
-        """  # noqa: W293
-        try:
-            client = get_client_from_context(ctx)
-
-            # Parse list strings (JSON arrays)
-            parsed_example_ids = None
-            if example_ids is not None:
-                try:
-                    parsed_example_ids = (
-                        json.loads(example_ids) if example_ids.startswith("[") else [example_ids]
-                    )
-                except (json.JSONDecodeError, AttributeError):
-                    parsed_example_ids = [example_ids] if example_ids else None
-
-            parsed_splits = None
-            if splits is not None:
-                try:
-                    parsed_splits = json.loads(splits) if splits.startswith("[") else [splits]
-                except (json.JSONDecodeError, AttributeError):
-                    parsed_splits = [splits] if splits else None
-
-            # Parse metadata (JSON object)
-            parsed_metadata = None
-            if metadata is not None:
-                try:
-                    parsed_metadata = json.loads(metadata) if metadata.startswith("{") else None
-                except (json.JSONDecodeError, AttributeError):
-                    parsed_metadata = None
-
-            # Parse boolean strings
-            parsed_inline_s3_urls = None
-            if inline_s3_urls is not None:
-                parsed_inline_s3_urls = inline_s3_urls.lower() == "true"
-
-            parsed_include_attachments = None
-            if include_attachments is not None:
-                parsed_include_attachments = include_attachments.lower() == "true"
-
-            # Parse integer strings
-            parsed_limit = int(limit) if limit else None
-            parsed_offset = int(offset) if offset else None
+    Note: Either dataset_id, dataset_name, or example_ids must be provided.
+    If multiple are provided, they are used in order of precedence: example_ids, dataset_id, dataset_name.
 
+    Args:
+        dataset_id (Optional[str]): Dataset ID to retrieve examples from
+        dataset_name (Optional[str]): Dataset name to retrieve examples from
+        example_ids (Optional[Union[List[str], str]]): Specific example IDs as a list, a JSON array string (e.g., '["id1", "id2"]') or a single ID
+        limit (Optional[int]): Maximum number of examples to return (default: 10)
+        offset (Optional[int]): Number of examples to skip (default: 0)
+        filter (Optional[str]): Filter string using LangSmith query syntax (e.g., 'has(metadata, {"key": "value"})')
+        metadata (Optional[Union[str, Dict[str, Any]]]): Metadata to filter by as an object or a JSON object string (e.g., '{"key": "value"}')
+        splits (Optional[Union[List[str], str]]): Dataset splits as a list, a JSON array string (e.g., '["train", "test"]') or a single split
+        inline_s3_urls (Optional[str]): Whether to inline S3 URLs: "true" or "false" (default: SDK default if not specified)
+        include_attachments (Optional[str]): Whether to include attachments: "true" or "false" (default: SDK default if not specified)
+        as_of (Optional[str]): Dataset version tag OR ISO timestamp to retrieve examples as of that version/time
+        ctx: FastMCP context (automatically provided)
+
+    Returns:
+        Dict[str, Any]: Dictionary containing the examples and metadata,
+                        or an error message if the examples cannot be retrieved
+    """  # noqa: W293
+    try:
+        client = get_client_from_context(ctx)
+
+        # Fast path for the common "examples of this dataset" call: nothing to parse,
+        # and list_examples_tool leaves out unset arguments itself
+        if (
+            example_ids is None
+            and splits is None
+            and metadata is None
+            and inline_s3_urls is None
+            and include_attachments is None
+        ):
             return list_examples_tool(
                 client,
                 dataset_id=dataset_id,
                 dataset_name=dataset_name,
-                example_ids=parsed_example_ids,
                 filter=filter,
-                metadata=parsed_metadata,
-                splits=parsed_splits,
-                inline_s3_urls=parsed_inline_s3_urls,
-                include_attachments=parsed_include_attachments,
-                as_of=as_of,
-                limit=parsed_limit,
-                offset=parsed_offset,
-            )
-        except Exception as e:
-            return {"error": str(e)}
-
-    @mcp.tool()
-    def read_dataset(
-        dataset_id: Optional[str] = None,
-        dataset_name: Optional[str] = None,
-        ctx: Context = None,
-    ) -> Dict[str, Any]:
-        """
-        Read a specific dataset from LangSmith.
-
-        Note: Either dataset_id or dataset_name must be provided to identify the dataset.
-        If both are provided, dataset_id takes precedence.
-
-        Args:
-            dataset_id (Optional[str]): Dataset ID to retrieve
-            dataset_name (Optional[str]): Dataset name to retrieve
-            ctx: FastMCP context (automatically provided)
-
-        Returns:
-            Dict[str, Any]: Dictionary containing the dataset details,
-                            or an error message if the dataset cannot be retrieved
-
-        Example in case you need to create a separate python script to read a dataset:
-            ```python
-            from langsmith import Client
-
-            client = Client()
-            dataset = client.read_dataset(dataset_name="My Dataset")
-            # Or by ID:
-            # dataset = client.read_dataset(dataset_id="dataset-id-here")
-            ```
-        """
-        try:
-            client = get_client_from_context(ctx)
-            return read_dataset_tool(
-                client,
-                dataset_id=dataset_id,
-                dataset_name=dataset_name,
-            )
-        except Exception as e:
-            return {"error": str(e)}
-
-    @mcp.tool()
-    def read_example(
-        example_id: str,
-        as_of: Optional[str] = None,
-        ctx: Context = None,
-    ) -> Dict[str, Any]:
-        """
-        Read a specific example from LangSmith.
-
-        Args:
-            example_id (str): Example ID to retrieve
-            as_of (Optional[str]): Dataset version tag OR ISO timestamp to retrieve the example as of that version/time
-            ctx: FastMCP context (automatically provided)
-
-        Returns:
-            Dict[str, Any]: Dictionary containing the example details,
-                            or an error message if the example cannot be retrieved
-
-        Example in case you need to create a separate python script to read an example:
-            ```python
-            from langsmith import Client
-
-            client = Client()
-            example = client.read_example(example_id="example-id-here")
-            # Or with version:
-            # example = client.read_example(example_id="example-id-here", as_of="v1.0")
-            ```
-        """
-        try:
-            client = get_client_from_context(ctx)
-            return read_example_tool(
-                client,
-                example_id=example_id,
                 as_of=as_of,
+                limit=limit,
+                offset=offset,
             )
-        except Exception as e:
-            return {"error": str(e)}
-
-    @mcp.tool()
-    def create_dataset(ctx: Context = None) -> None:
-        """
-        Documentation tool for understanding how to create datasets in LangSmith.
-
-        This tool provides comprehensive documentation on creating datasets programmatically
-        using the LangSmith Python SDK, including creating datasets from lists, traces, CSV files,
-        and pandas DataFrames.
-
-        ---
-        🧩 PURPOSE
-        ----------
-        This is a **documentation-only tool** that explains how to:
-        - Create datasets from lists of examples
-        - Create datasets from traces/runs
-        - Create datasets from CSV files
-        - Create datasets from pandas DataFrames
-        - Add examples to datasets using bulk operations
-
-        ---
-        📦 REQUIRED DEPENDENCIES
-        ------------------------
-        To use the functionality described in this documentation, you need:
-        - `langsmith` - The LangSmith Python client
-        - `pandas` (optional) - Required only for DataFrame operations
-
-        Install with:
-        ```bash
-        pip install langsmith
-        # Optional, for DataFrame operations:
-        pip install pandas
-        ```
-
-        ---
-        🔧 CREATING DATASETS
-        --------------------
-
-        1️⃣ **Create Dataset from List of Values**
-
-        The most flexible way to create a dataset is by creating examples from a list of inputs
-        and optional outputs. You can add arbitrary metadata to each example.
-
-        ```python
-        from langsmith import Client
-
-        client = Client()
-
-        examples = [
-            {
-                "inputs": {"question": "What is the largest mammal?"},
-                "outputs": {"answer": "The blue whale"},
-                "metadata": {"source": "Wikipedia"},
-            },
-            {
-                "inputs": {"question": "What do mammals and birds have in common?"},
-                "outputs": {"answer": "They are both warm-blooded"},
-                "metadata": {"source": "Wikipedia"},
-            },
-            {
-                "inputs": {"question": "What are reptiles known for?"},
-                "outputs": {"answer": "Having scales"},
-                "metadata": {"source": "Wikipedia"},
-            },
-        ]
-
-        dataset_name = "Elementary Animal Questions"
-
-        # Create the dataset
-        dataset = client.create_dataset(
-            dataset_name=dataset_name,
-            description="Questions and answers about animal phylogenetics.",
-        )
-
-        # Bulk create examples (more efficient than creating one at a time)
-        client.create_examples(
-            dataset_id=dataset.id,
-            examples=examples
-        )
-        ```
-
-        **Note:** For many examples, use `create_examples()` for bulk creation. For a single
-        example, use `create_example()`.
-
-        2️⃣ **Create Dataset from Traces**
-
-        You can create datasets from the runs (spans) of your traces by filtering runs and
-        converting them to examples.
 
-        ```python
-        from langsmith import Client
-
-        client = Client()
-        dataset_name = "Example Dataset"
-
-        # Filter runs to add to the dataset
-        runs = client.list_runs(
-            project_name="my_project",
-            is_root=True,
-            error=False,
-        )
-
-        # Create the dataset
-        dataset = client.create_dataset(
-            dataset_name=dataset_name,
-            description="An example dataset"
-        )
-
-        # Prepare inputs and outputs for bulk creation
-        examples = [
-            {"inputs": run.inputs, "outputs": run.outputs}
-            for run in runs
-        ]
-
-        # Use the bulk create_examples method
-        client.create_examples(
-            dataset_id=dataset.id,
-            examples=examples
-        )
-        ```
-
-        3️⃣ **Create Dataset from CSV File**
-
-        You can create a dataset by uploading a CSV file. Ensure your CSV has columns that
-        represent your input and output keys.
-
-        ```python
-        from langsmith import Client
+        raw = {
+            "dataset_id": dataset_id,
+            "dataset_name": dataset_name,
+            "example_ids": example_ids,
+            "filter": filter,
+            "metadata": metadata,
+            "splits": splits,
+            "inline_s3_urls": inline_s3_urls,
+            "include_attachments": include_attachments,
+            "as_of": as_of,
+            "limit": limit,
+            "offset": offset,
+        }
+        # Parse the provided arguments that need it and leave out unset ones
+        kwargs = {}
+        for name, value in raw.items():
+            if value is not None and name in _LIST_EXAMPLES_PARSERS:
+                value = _LIST_EXAMPLES_PARSERS[name](value)
+            if value is not None:
+                kwargs[name] = value
+        return list_examples_tool(client, **kwargs)
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def _check_read_dataset(
+    dataset_id: Optional[str] = None, dataset_name: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """Check that read_dataset has a dataset to read."""
+    if not dataset_id and not dataset_name:
+        return {"error": "Error: Either dataset_id or dataset_name must be provided."}
+    return None
+
+
+@_langsmith_tool(precheck=_check_read_dataset)
+def read_dataset(
+    client: Client,
+    dataset_id: Optional[str] = None,
+    dataset_name: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Read a specific dataset from LangSmith.
 
-        client = Client()
+    Note: Either dataset_id or dataset_name must be provided to identify the dataset.
+    If both are provided, dataset_id takes precedence.
 
-        csv_file = 'path/to/your/csvfile.csv'
-        input_keys = ['column1', 'column2']  # Replace with your input column names
-        output_keys = ['output1', 'output2']  # Replace with your output column names
-
-        dataset = client.upload_csv(
-            csv_file=csv_file,
-            input_keys=input_keys,
-            output_keys=output_keys,
-            name="My CSV Dataset",
-            description="Dataset created from a CSV file",
-            data_type="kv"  # "kv" or "chat"
-        )
-        ```
-
-        4️⃣ **Create Dataset from Pandas DataFrame (Python only)**
+    Args:
+        dataset_id (Optional[str]): Dataset ID to retrieve
+        dataset_name (Optional[str]): Dataset name to retrieve
+        ctx: FastMCP context (automatically provided)
 
-        The Python client offers a convenience method to upload a dataset from a pandas DataFrame.
+    Returns:
+        Dict[str, Any]: Dictionary containing the dataset details,
+                        or an error message if the dataset cannot be retrieved
 
+    Example in case you need to create a separate python script to read a dataset:
         ```python
         from langsmith import Client
-        import pandas as pd
 
         client = Client()
-
-        # Load your data
-        df = pd.read_parquet('path/to/your/myfile.parquet')
-        # Or: df = pd.read_csv('path/to/your/myfile.csv')
-
-        input_keys = ['column1', 'column2']  # Replace with your input column names
-        output_keys = ['output1', 'output2']  # Replace with your output column names
-
-        dataset = client.upload_dataframe(
-            df=df,
-            input_keys=input_keys,
-            output_keys=output_keys,
-            name="My Parquet Dataset",
-            description="Dataset created from a parquet file",
-            data_type="kv"  # The default, can also be "chat"
-        )
+        dataset = client.read_dataset(dataset_name="My Dataset")
+        # Or by ID:
+        # dataset = client.read_dataset(dataset_id="dataset-id-here")
         ```
+    """
+    return read_dataset_tool(
+        client,
+        dataset_id=dataset_id,
+        dataset_name=dataset_name,
+    )
+
+
+def _check_read_example(example_id: str, as_of: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Check that read_example has an example to read."""
+    if not example_id:
+        return {"error": "Error: example_id must be provided."}
+    return None
+
+
+@_langsmith_tool(precheck=_check_read_example)
+def read_example(
+    client: Client,
+    example_id: str,
+    as_of: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Read a specific example from LangSmith.
 
-        ---
-        📝 DATASET STRUCTURE
-        --------------------
-        Each example in a dataset should have:
-        - `inputs` (dict): The input data for the example
-        - `outputs` (dict, optional): The expected output data
-        - `metadata` (dict, optional): Arbitrary metadata (e.g., source, notes, tags)
-
-        ---
-        📤 RETURNS
-        ----------
-        None
-            This tool is documentation-only and returns None. The documentation is in the docstring.
-
-        ---
-        🧠 NOTES FOR AGENTS
-        --------------------
-        - This tool is **documentation-only** - it does not execute any code
-        - Use `create_examples()` for bulk operations (more efficient)
-        - Use `create_example()` for single example creation
-        - Datasets can be of type "kv" (key-value) or "chat" (conversational)
-        - Metadata is stored as a dictionary and can contain any key-value pairs
-        - Always ensure you have the required dependencies installed before using these patterns
-        - The dataset name should be unique and descriptive
-        """  # noqa: W293
-        return None
-
-    @mcp.tool()
-    def update_examples(ctx: Context = None) -> None:
-        """
-        Documentation tool for understanding how to update dataset examples in LangSmith.
-
-        This tool provides comprehensive documentation on updating examples programmatically
-        using the LangSmith Python SDK, including single example updates and bulk updates.
-
-        ---
-        🧩 PURPOSE
-        ----------
-        This is a **documentation-only tool** that explains how to:
-        - Update a single example in a dataset
-        - Bulk update multiple examples in a single request
-        - Update inputs, outputs, metadata, and splits
-
-        ---
-        📦 REQUIRED DEPENDENCIES
-        ------------------------
-        To use the functionality described in this documentation, you need:
-        - `langsmith` - The LangSmith Python client
-
-        Install with:
-        ```bash
-        pip install langsmith
-        ```
-
-        ---
-        🔧 UPDATING EXAMPLES
-        --------------------
-
-        1️⃣ **Update Single Example**
+    Args:
+        example_id (str): Example ID to retrieve
+        as_of (Optional[str]): Dataset version tag OR ISO timestamp to retrieve the example as of that version/time
+        ctx: FastMCP context (automatically provided)
 
-        You can update a single example using the `update_example()` method. You can update
-        inputs, outputs, metadata, and split assignments.
+    Returns:
+        Dict[str, Any]: Dictionary containing the example details,
+                        or an error message if the example cannot be retrieved
 
+    Example in case you need to create a separate python script to read an example:
         ```python
         from langsmith import Client
 
         client = Client()
-
-        # Update a single example
-        client.update_example(
-            example_id=example.id,  # The example ID to update
-            inputs={"input": "updated input"},
-            outputs={"output": "updated output"},
-            metadata={"foo": "bar", "source": "updated"},
-            split="train"  # Can be a string or list of strings
-        )
+        example = client.read_example(example_id="example-id-here")
+        # Or with version:
+        # example = client.read_example(example_id="example-id-here", as_of="v1.0")
         ```
+    """
+    if _is_fixed_as_of(as_of):
+        return _read_example_cached(client, example_id, as_of)
+    return _read_example_single_flight(client, example_id, as_of)
 
-        **Parameters:**
-        - `example_id` (str, required): The ID of the example to update
-        - `inputs` (dict, optional): Updated input data
-        - `outputs` (dict, optional): Updated output data
-        - `metadata` (dict, optional): Updated metadata dictionary
-        - `split` (str or list, optional): Updated split assignment(s)
-
-        2️⃣ **Bulk Update Examples**
-
-        You can update multiple examples in a single request using the `update_examples()` method.
-        This is more efficient than updating examples one at a time.
-
-        ```python
-        from langsmith import Client
-
-        client = Client()
 
-        # Update multiple examples at once
-        client.update_examples(
-            example_ids=[example.id, example_2.id],
-            inputs=[
-                {"input": "updated input 1"},
-                {"input": "updated input 2"}
-            ],
-            outputs=[
-                {"output": "updated output 1"},
-                {"output": "updated output 2"}
-            ],
-            metadata=[
-                {"foo": "baz", "source": "source1"},
-                {"foo": "qux", "source": "source2"}
-            ],
-            splits=[
-                ["training", "foo"],  # Splits can be arrays
-                "training"            # Or standalone strings
-            ]
-        )
+async def batch_execute(
+    operations: str,
+    max_concurrent: int = 8,
+    stop_on_error: str = "false",
+    ctx: Context = None,
+) -> Dict[str, Any]:
+    """
+    Execute several LangSmith tools in a single call.
+
+    ---
+    🧩 PURPOSE
+    ----------
+    Use this tool to avoid a round-trip per tool call when you already know the
+    sequence of lookups you need (e.g. list projects, fetch runs, list datasets).
+    The operations run concurrently on the server and their results are returned
+    together, in the same order as requested.
+
+    ---
+    ⚙️ PARAMETERS
+    -------------
+    operations : str
+        JSON array string of operations. Each operation is an object with the tool
+        name and its arguments, using the same argument names as when calling the
+        tool directly:
+        ```json
+        [
+            {"tool": "list_projects", "args": {"limit": 3}},
+            {"tool": "fetch_runs", "args": {"project_name": "alpha-project", "limit": 5}}
+        ]
         ```
+        Supported tools: list_prompts, get_prompt_by_name, fetch_runs, list_projects,
+        list_experiments, list_datasets, list_examples, read_dataset, read_example.
+
+    max_concurrent : int, default 8
+        Maximum number of operations executed at the same time.
+
+    stop_on_error : str, default "false"
+        If "true", operations that have not started yet are skipped once any
+        operation fails. Operations that are already running are not interrupted.
+
+    ---
+    📤 RETURNS
+    ----------
+    Dict[str, Any]
+        A dictionary with a "results" key containing one entry per operation:
+        `{"tool": ..., "result": {...}}` on success or `{"tool": ..., "error": "..."}`
+        on failure.
+
+    ---
+    🧠 NOTES FOR AGENTS
+    --------------------
+    - A failing operation does not fail the whole batch; check each entry for an "error" key
+    - Only data-returning tools can be batched; documentation-only tools are not supported
+    - Several `read_example` operations are fetched together with one request, so batching
+    them is much faster than reading examples one by one
+    """  # noqa: W293
+    try:
+        parsed_operations = json_loads(operations)
+    except JSONDecodeError as e:
+        return {"error": f"operations must be a JSON array string: {str(e)}"}
+    if not isinstance(parsed_operations, list):
+        return {"error": "operations must be a JSON array string"}
+
+    return await _execute_batch(
+        parsed_operations,
+        max_concurrent=max_concurrent,
+        stop_on_error=parse_bool(stop_on_error) is True,
+        ctx=ctx,
+    )
+
+
+@_langsmith_tool
+def clear_caches(client: Client) -> Dict[str, Any]:
+    """
+    Clear the server-side response caches for your LangSmith configuration.
 
-        **Parameters:**
-        - `example_ids` (list[str], required): List of example IDs to update
-        - `inputs` (list[dict], optional): List of updated input dictionaries
-        - `outputs` (list[dict], optional): List of updated output dictionaries
-        - `metadata` (list[dict], optional): List of updated metadata dictionaries
-        - `splits` (list[str or list], optional): List of split assignments (can be strings or lists)
-
-        **Important Notes:**
-        - All list parameters must have the same length as `example_ids`
-        - Each list index corresponds to the example at the same index in `example_ids`
-        - Splits can be either a single string or a list of strings (for multiple splits)
-        - You can update any combination of fields - you don't need to provide all parameters
-
-        3️⃣ **Partial Updates**
-
-        You can update only specific fields without providing all parameters:
-
-        ```python
-        # Update only metadata for a single example
-        client.update_example(
-            example_id=example.id,
-            metadata={"updated_at": "2024-01-01", "status": "reviewed"}
-        )
+    read_example results requested with a past ISO timestamp as `as_of` are cached,
+    since the example cannot change at that point in time. Use this tool to drop
+    those cached results, e.g. after an example's history was rewritten.
+    Only the entries cached for your API key, workspace and endpoint are removed.
 
-        # Update only outputs for multiple examples
-        client.update_examples(
-            example_ids=[example.id, example_2.id],
-            outputs=[
-                {"output": "new output 1"},
-                {"output": "new output 2"}
-            ]
-        )
-        ```
+    Returns:
+        Dict[str, Any]: Dictionary with the number of cached entries that were removed
+    """
+    with _EXAMPLE_CACHE_LOCK:
+        cache = _EXAMPLE_CACHE.pop(client_config_key(client), None)
+    return {"cleared": len(cache) if cache is not None else 0}
 
-        ---
-        📝 SPLIT ASSIGNMENTS
-        ---------------------
-        Examples can be assigned to one or more splits (e.g., "train", "test", "validation"):
 
-        ```python
-        # Single split
-        client.update_example(example_id=example.id, split="train")
+def create_dataset(ctx: Context = None) -> None:
+    """
+    Documentation tool for understanding how to create datasets in LangSmith.
+
+    This tool provides comprehensive documentation on creating datasets programmatically
+    using the LangSmith Python SDK, including creating datasets from lists, traces, CSV files,
+    and pandas DataFrames.
+
+    ---
+    🧩 PURPOSE
+    ----------
+    This is a **documentation-only tool** that explains how to:
+    - Create datasets from lists of examples
+    - Create datasets from traces/runs
+    - Create datasets from CSV files
+    - Create datasets from pandas DataFrames
+    - Add examples to datasets using bulk operations
+
+    ---
+    📦 REQUIRED DEPENDENCIES
+    ------------------------
+    To use the functionality described in this documentation, you need:
+    - `langsmith` - The LangSmith Python client
+    - `pandas` (optional) - Required only for DataFrame operations
+
+    Install with:
+    ```bash
+    pip install langsmith
+    # Optional, for DataFrame operations:
+    pip install pandas
+    ```
+
+    ---
+    🔧 CREATING DATASETS
+    --------------------
+
+    1️⃣ **Create Dataset from List of Values**
+
+    The most flexible way to create a dataset is by creating examples from a list of inputs
+    and optional outputs. You can add arbitrary metadata to each example.
+
+    ```python
+    from langsmith import Client
+
+    client = Client()
+
+    examples = [
+        {
+            "inputs": {"question": "What is the largest mammal?"},
+            "outputs": {"answer": "The blue whale"},
+            "metadata": {"source": "Wikipedia"},
+        },
+        {
+            "inputs": {"question": "What do mammals and birds have in common?"},
+            "outputs": {"answer": "They are both warm-blooded"},
+            "metadata": {"source": "Wikipedia"},
+        },
+        {
+            "inputs": {"question": "What are reptiles known for?"},
+            "outputs": {"answer": "Having scales"},
+            "metadata": {"source": "Wikipedia"},
+        },
+    ]
+
+    dataset_name = "Elementary Animal Questions"
+
+    # Create the dataset
+    dataset = client.create_dataset(
+        dataset_name=dataset_name,
+        description="Questions and answers about animal phylogenetics.",
+    )
+
+    # Bulk create examples (more efficient than creating one at a time)
+    client.create_examples(
+        dataset_id=dataset.id,
+        examples=examples
+    )
+    ```
+
+    **Note:** For many examples, use `create_examples()` for bulk creation. For a single
+    example, use `create_example()`.
+
+    2️⃣ **Create Dataset from Traces**
+
+    You can create datasets from the runs (spans) of your traces by filtering runs and
+    converting them to examples.
+
+    ```python
+    from langsmith import Client
+
+    client = Client()
+    dataset_name = "Example Dataset"
+
+    # Filter runs to add to the dataset
+    runs = client.list_runs(
+        project_name="my_project",
+        is_root=True,
+        error=False,
+    )
+
+    # Create the dataset
+    dataset = client.create_dataset(
+        dataset_name=dataset_name,
+        description="An example dataset"
+    )
+
+    # Prepare inputs and outputs for bulk creation
+    examples = [
+        {"inputs": run.inputs, "outputs": run.outputs}
+        for run in runs
+    ]
+
+    # Use the bulk create_examples method
+    client.create_examples(
+        dataset_id=dataset.id,
+        examples=examples
+    )
+    ```
+
+    3️⃣ **Create Dataset from CSV File**
+
+    You can create a dataset by uploading a CSV file. Ensure your CSV has columns that
+    represent your input and output keys.
+
+    ```python
+    from langsmith import Client
+
+    client = Client()
+
+    csv_file = 'path/to/your/csvfile.csv'
+    input_keys = ['column1', 'column2']  # Replace with your input column names
+    output_keys = ['output1', 'output2']  # Replace with your output column names
+
+    dataset = client.upload_csv(
+        csv_file=csv_file,
+        input_keys=input_keys,
+        output_keys=output_keys,
+        name="My CSV Dataset",
+        description="Dataset created from a CSV file",
+        data_type="kv"  # "kv" or "chat"
+    )
+    ```
+
+    4️⃣ **Create Dataset from Pandas DataFrame (Python only)**
+
+    The Python client offers a convenience method to upload a dataset from a pandas DataFrame.
+
+    ```python
+    from langsmith import Client
+    import pandas as pd
+
+    client = Client()
+
+    # Load your data
+    df = pd.read_parquet('path/to/your/myfile.parquet')
+    # Or: df = pd.read_csv('path/to/your/myfile.csv')
+
+    input_keys = ['column1', 'column2']  # Replace with your input column names
+    output_keys = ['output1', 'output2']  # Replace with your output column names
+
+    dataset = client.upload_dataframe(
+        df=df,
+        input_keys=input_keys,
+        output_keys=output_keys,
+        name="My Parquet Dataset",
+        description="Dataset created from a parquet file",
+        data_type="kv"  # The default, can also be "chat"
+    )
+    ```
+
+    ---
+    📝 DATASET STRUCTURE
+    --------------------
+    Each example in a dataset should have:
+    - `inputs` (dict): The input data for the example
+    - `outputs` (dict, optional): The expected output data
+    - `metadata` (dict, optional): Arbitrary metadata (e.g., source, notes, tags)
+
+    ---
+    📤 RETURNS
+    ----------
+    None
+        This tool is documentation-only and returns None. The documentation is in the docstring.
+
+    ---
+    🧠 NOTES FOR AGENTS
+    --------------------
+    - This tool is **documentation-only** - it does not execute any code
+    - Use `create_examples()` for bulk operations (more efficient)
+    - Use `create_example()` for single example creation
+    - Datasets can be of type "kv" (key-value) or "chat" (conversational)
+    - Metadata is stored as a dictionary and can contain any key-value pairs
+    - Always ensure you have the required dependencies installed before using these patterns
+    - The dataset name should be unique and descriptive
+    """  # noqa: W293
+    return None
+
+
+def update_examples(ctx: Context = None) -> None:
+    """
+    Documentation tool for understanding how to update dataset examples in LangSmith.
+
+    This tool provides comprehensive documentation on updating examples programmatically
+    using the LangSmith Python SDK, including single example updates and bulk updates.
+
+    ---
+    🧩 PURPOSE
+    ----------
+    This is a **documentation-only tool** that explains how to:
+    - Update a single example in a dataset
+    - Bulk update multiple examples in a single request
+    - Update inputs, outputs, metadata, and splits
+
+    ---
+    📦 REQUIRED DEPENDENCIES
+    ------------------------
+    To use the functionality described in this documentation, you need:
+    - `langsmith` - The LangSmith Python client
+
+    Install with:
+    ```bash
+    pip install langsmith
+    ```
+
+    ---
+    🔧 UPDATING EXAMPLES
+    --------------------
+
+    1️⃣ **Update Single Example**
+
+    You can update a single example using the `update_example()` method. You can update
+    inputs, outputs, metadata, and split assignments.
+
+    ```python
+    from langsmith import Client
+
+    client = Client()
+
+    # Update a single example
+    client.update_example(
+        example_id=example.id,  # The example ID to update
+        inputs={"input": "updated input"},
+        outputs={"output": "updated output"},
+        metadata={"foo": "bar", "source": "updated"},
+        split="train"  # Can be a string or list of strings
+    )
+    ```
+
+    **Parameters:**
+    - `example_id` (str, required): The ID of the example to update
+    - `inputs` (dict, optional): Updated input data
+    - `outputs` (dict, optional): Updated output data
+    - `metadata` (dict, optional): Updated metadata dictionary
+    - `split` (str or list, optional): Updated split assignment(s)
+
+    2️⃣ **Bulk Update Examples**
+
+    You can update multiple examples in a single request using the `update_examples()` method.
+    This is more efficient than updating examples one at a time.
+
+    ```python
+    from langsmith import Client
+
+    client = Client()
+
+    # Update multiple examples at once
+    client.update_examples(
+        example_ids=[example.id, example_2.id],
+        inputs=[
+            {"input": "updated input 1"},
+            {"input": "updated input 2"}
+        ],
+        outputs=[
+            {"output": "updated output 1"},
+            {"output": "updated output 2"}
+        ],
+        metadata=[
+            {"foo": "baz", "source": "source1"},
+            {"foo": "qux", "source": "source2"}
+        ],
+        splits=[
+            ["training", "foo"],  # Splits can be arrays
+            "training"            # Or standalone strings
+        ]
+    )
+    ```
+
+    **Parameters:**
+    - `example_ids` (list[str], required): List of example IDs to update
+    - `inputs` (list[dict], optional): List of updated input dictionaries
+    - `outputs` (list[dict], optional): List of updated output dictionaries
+    - `metadata` (list[dict], optional): List of updated metadata dictionaries
+    - `splits` (list[str or list], optional): List of split assignments (can be strings or lists)
+
+    **Important Notes:**
+    - All list parameters must have the same length as `example_ids`
+    - Each list index corresponds to the example at the same index in `example_ids`
+    - Splits can be either a single string or a list of strings (for multiple splits)
+    - You can update any combination of fields - you don't need to provide all parameters
+
+    3️⃣ **Partial Updates**
+
+    You can update only specific fields without providing all parameters:
+
+    ```python
+    # Update only metadata for a single example
+    client.update_example(
+        example_id=example.id,
+        metadata={"updated_at": "2024-01-01", "status": "reviewed"}
+    )
+
+    # Update only outputs for multiple examples
+    client.update_examples(
+        example_ids=[example.id, example_2.id],
+        outputs=[
+            {"output": "new output 1"},
+            {"output": "new output 2"}
+        ]
+    )
+    ```
+
+    ---
+    📝 SPLIT ASSIGNMENTS
+    ---------------------
+    Examples can be assigned to one or more splits (e.g., "train", "test", "validation"):
+
+    ```python
+    # Single split
+    client.update_example(example_id=example.id, split="train")
+
+    # Multiple splits
+    client.update_example(example_id=example.id, split=["train", "validation"])
+
+    # In bulk updates, each example can have different split assignments
+    client.update_examples(
+        example_ids=[example.id, example_2.id],
+        splits=["train", ["train", "test"]]
+    )
+    ```
+
+    ---
+    📤 RETURNS
+    ----------
+    None
+        This tool is documentation-only and returns None. The documentation is in the docstring.
+
+    ---
+    🧠 NOTES FOR AGENTS
+    --------------------
+    - This tool is **documentation-only** - it does not execute any code
+    - Use `update_examples()` for bulk operations (more efficient than single updates)
+    - Use `update_example()` for single example updates
+    - All list parameters in bulk updates must match the length of `example_ids`
+    - You can update any combination of fields - partial updates are supported
+    - Splits can be strings or lists of strings (for multiple split assignments)
+    - Always ensure you have the required dependencies installed before using these patterns
+    - Example IDs can be obtained from `list_examples()` or `read_example()` methods
+    """
+    return None
 
-        # Multiple splits
-        client.update_example(example_id=example.id, split=["train", "validation"])
 
-        # In bulk updates, each example can have different split assignments
-        client.update_examples(
-            example_ids=[example.id, example_2.id],
-            splits=["train", ["train", "test"]]
+def run_experiment(ctx: Context = None) -> None:
+    """
+    Documentation tool for understanding how to run experiments and evaluations in LangSmith.
+
+    This tool provides comprehensive documentation on running evaluations using LangSmith's
+    evaluate SDK, creating custom evaluators, and using the openevals library for pre-built
+    evaluators like LLM-as-judge and trajectory evaluators.
+
+    ---
+    🧩 PURPOSE
+    ----------
+    This is a **documentation-only tool** that explains how to:
+    - Run experiments using LangSmith's `evaluate()` method
+    - Create custom evaluator functions in Python
+    - Use openevals library for pre-built evaluators
+    - Set up LLM-as-judge evaluators
+    - Use trajectory evaluators for multi-turn conversations
+
+    ---
+    📦 REQUIRED DEPENDENCIES
+    ------------------------
+    To use the functionality described in this documentation, you need:
+    - `langsmith` - The LangSmith Python client (>=0.3.13 for evaluate)
+    - `openevals` (optional) - For pre-built evaluators like LLM-as-judge
+
+    Install with:
+    ```bash
+    pip install langsmith
+    # Optional, for pre-built evaluators:
+    pip install openevals
+    ```
+
+    ---
+    🔧 RUNNING EXPERIMENTS WITH LANGSMITH
+    -------------------------------------
+
+    1️⃣ **Basic Evaluation Setup**
+
+    The `evaluate()` method runs your application on a dataset and scores outputs using evaluators.
+
+    ```python
+    from langsmith import Client, traceable, wrappers
+    from openai import OpenAI
+
+    # Step 1: Define your application
+    oai_client = wrappers.wrap_openai(OpenAI())
+
+    @traceable
+    def toxicity_classifier(inputs: dict) -> dict:
+        instructions = (
+            "Please review the user query below and determine if it contains any form of "
+            "toxic behavior, such as insults, threats, or highly negative comments. "
+            "Respond with 'Toxic' if it does and 'Not toxic' if it doesn't."
         )
-        ```
-
-        ---
-        📤 RETURNS
-        ----------
-        None
-            This tool is documentation-only and returns None. The documentation is in the docstring.
-
-        ---
-        🧠 NOTES FOR AGENTS
-        --------------------
-        - This tool is **documentation-only** - it does not execute any code
-        - Use `update_examples()` for bulk operations (more efficient than single updates)
-        - Use `update_example()` for single example updates
-        - All list parameters in bulk updates must match the length of `example_ids`
-        - You can update any combination of fields - partial updates are supported
-        - Splits can be strings or lists of strings (for multiple split assignments)
-        - Always ensure you have the required dependencies installed before using these patterns
-        - Example IDs can be obtained from `list_examples()` or `read_example()` methods
-        """
-        return None
-
-    @mcp.tool()
-    def run_experiment(ctx: Context = None) -> None:
-        """
-        Documentation tool for understanding how to run experiments and evaluations in LangSmith.
-
-        This tool provides comprehensive documentation on running evaluations using LangSmith's
-        evaluate SDK, creating custom evaluators, and using the openevals library for pre-built
-        evaluators like LLM-as-judge and trajectory evaluators.
-
-        ---
-        🧩 PURPOSE
-        ----------
-        This is a **documentation-only tool** that explains how to:
-        - Run experiments using LangSmith's `evaluate()` method
-        - Create custom evaluator functions in Python
-        - Use openevals library for pre-built evaluators
-        - Set up LLM-as-judge evaluators
-        - Use trajectory evaluators for multi-turn conversations
-
-        ---
-        📦 REQUIRED DEPENDENCIES
-        ------------------------
-        To use the functionality described in this documentation, you need:
-        - `langsmith` - The LangSmith Python client (>=0.3.13 for evaluate)
-        - `openevals` (optional) - For pre-built evaluators like LLM-as-judge
-
-        Install with:
-        ```bash
-        pip install langsmith
-        # Optional, for pre-built evaluators:
-        pip install openevals
-        ```
-
-        ---
-        🔧 RUNNING EXPERIMENTS WITH LANGSMITH
-        -------------------------------------
-
-        1️⃣ **Basic Evaluation Setup**
-
-        The `evaluate()` method runs your application on a dataset and scores outputs using evaluators.
-
-        ```python
-        from langsmith import Client, traceable, wrappers
-        from openai import OpenAI
-
-        # Step 1: Define your application
-        oai_client = wrappers.wrap_openai(OpenAI())
-
-        @traceable
-        def toxicity_classifier(inputs: dict) -> dict:
-            instructions = (
-                "Please review the user query below and determine if it contains any form of "
-                "toxic behavior, such as insults, threats, or highly negative comments. "
-                "Respond with 'Toxic' if it does and 'Not toxic' if it doesn't."
-            )
-            messages = [
-                {"role": "system", "content": instructions},
-                {"role": "user", "content": inputs["text"]},
-            ]
-            result = oai_client.chat.completions.create(
-                messages=messages, model="gpt-4o-mini", temperature=0
-            )
-            return {"class": result.choices[0].message.content}
-
-        # Step 2: Create or select a dataset
-        ls_client = Client()
-        dataset = ls_client.create_dataset(dataset_name="Toxic Queries")
-
-        examples = [
-            {"inputs": {"text": "Shut up, idiot"}, "outputs": {"label": "Toxic"}},
-            {"inputs": {"text": "You're a wonderful person"}, "outputs": {"label": "Not toxic"}},
+        messages = [
+            {"role": "system", "content": instructions},
+            {"role": "user", "content": inputs["text"]},
         ]
-        ls_client.create_examples(dataset_id=dataset.id, examples=examples)
-
-        # Step 3: Define an evaluator
-        def correct(inputs: dict, outputs: dict, reference_outputs: dict) -> bool:
-            return outputs["class"] == reference_outputs["label"]
-
-        # Step 4: Run the evaluation
-        results = ls_client.evaluate(
-            toxicity_classifier,
-            data=dataset.name,
-            evaluators=[correct],
-            experiment_prefix="gpt-4o-mini, baseline",
-            description="Testing the baseline system.",
-            max_concurrency=4,  # Optional: parallelize evaluation
-        )
-        ```
-
-        **Key Parameters:**
-        - `target`: Your application function (takes inputs dict, returns outputs dict)
-        - `data`: Dataset name or UUID, or an iterator of examples
-        - `evaluators`: List of evaluator functions
-        - `experiment_prefix`: Optional name prefix for the experiment
-        - `description`: Optional experiment description
-        - `max_concurrency`: Optional number of parallel workers
-
-        2️⃣ **Creating Custom Evaluators**
-
-        Evaluators are functions that score your application's outputs. They receive:
-        - `inputs`: The example inputs
-        - `outputs`: Your application's actual outputs
-        - `reference_outputs`: Expected outputs (if available)
-
-        ```python
-        # Simple boolean evaluator
-        def correct(inputs: dict, outputs: dict, reference_outputs: dict) -> bool:
-            return outputs["class"] == reference_outputs["label"]
-
-        # Evaluator with score and comment
-        def correctness_with_feedback(
-            inputs: dict, outputs: dict, reference_outputs: dict
-        ) -> dict:
-            is_correct = outputs["class"] == reference_outputs["label"]
-            comment = "Match" if is_correct else "Mismatch"
-            return {
-                "key": "correctness",
-                "score": is_correct,
-                "comment": comment
-            }
-
-        # Evaluator that returns a float score
-        def similarity_score(
-            inputs: dict, outputs: dict, reference_outputs: dict
-        ) -> float:
-            # Calculate some similarity metric (0.0 to 1.0)
-            return 0.85
-        ```
-
-        **Evaluator Return Types:**
-        - `bool`: Binary score (True/False)
-        - `float`: Numeric score (0.0 to 1.0)
-        - `dict`: Full result with `key`, `score`, and optional `comment`
-
-        ---
-        🎯 USING OPENEVALS FOR PRE-BUILT EVALUATORS
-        -------------------------------------------
-
-        The `openevals` library provides pre-built evaluators that you can use out of the box.
-
-        1️⃣ **LLM-as-Judge Evaluators**
-
-        Use an LLM to judge your application's outputs. This is useful when you need subjective
-        evaluation or don't have reference outputs.
-
-        ```python
-        from openevals.llm import create_llm_as_judge
-        from openevals.prompts import CORRECTNESS_PROMPT, CONCISENESS_PROMPT
-
-        # Correctness evaluator (requires reference outputs)
-        correctness_evaluator = create_llm_as_judge(
-            prompt=CORRECTNESS_PROMPT,
-            feedback_key="correctness",
-            model="openai:o3-mini",
+        result = oai_client.chat.completions.create(
+            messages=messages, model="gpt-4o-mini", temperature=0
         )
+        return {"class": result.choices[0].message.content}
+
+    # Step 2: Create or select a dataset
+    ls_client = Client()
+    dataset = ls_client.create_dataset(dataset_name="Toxic Queries")
+
+    examples = [
+        {"inputs": {"text": "Shut up, idiot"}, "outputs": {"label": "Toxic"}},
+        {"inputs": {"text": "You're a wonderful person"}, "outputs": {"label": "Not toxic"}},
+    ]
+    ls_client.create_examples(dataset_id=dataset.id, examples=examples)
+
+    # Step 3: Define an evaluator
+    def correct(inputs: dict, outputs: dict, reference_outputs: dict) -> bool:
+        return outputs["class"] == reference_outputs["label"]
+
+    # Step 4: Run the evaluation
+    results = ls_client.evaluate(
+        toxicity_classifier,
+        data=dataset.name,
+        evaluators=[correct],
+        experiment_prefix="gpt-4o-mini, baseline",
+        description="Testing the baseline system.",
+        max_concurrency=4,  # Optional: parallelize evaluation
+    )
+    ```
+
+    **Key Parameters:**
+    - `target`: Your application function (takes inputs dict, returns outputs dict)
+    - `data`: Dataset name or UUID, or an iterator of examples
+    - `evaluators`: List of evaluator functions
+    - `experiment_prefix`: Optional name prefix for the experiment
+    - `description`: Optional experiment description
+    - `max_concurrency`: Optional number of parallel workers
+
+    2️⃣ **Creating Custom Evaluators**
+
+    Evaluators are functions that score your application's outputs. They receive:
+    - `inputs`: The example inputs
+    - `outputs`: Your application's actual outputs
+    - `reference_outputs`: Expected outputs (if available)
+
+    ```python
+    # Simple boolean evaluator
+    def correct(inputs: dict, outputs: dict, reference_outputs: dict) -> bool:
+        return outputs["class"] == reference_outputs["label"]
+
+    # Evaluator with score and comment
+    def correctness_with_feedback(
+        inputs: dict, outputs: dict, reference_outputs: dict
+    ) -> dict:
+        is_correct = outputs["class"] == reference_outputs["label"]
+        comment = "Match" if is_correct else "Mismatch"
+        return {
+            "key": "correctness",
+            "score": is_correct,
+            "comment": comment
+        }
 
-        # Conciseness evaluator (no reference needed)
-        conciseness_evaluator = create_llm_as_judge(
-            prompt=CONCISENESS_PROMPT,
-            feedback_key="conciseness",
-            model="openai:o3-mini",
+    # Evaluator that returns a float score
+    def similarity_score(
+        inputs: dict, outputs: dict, reference_outputs: dict
+    ) -> float:
+        # Calculate some similarity metric (0.0 to 1.0)
+        return 0.85
+    ```
+
+    **Evaluator Return Types:**
+    - `bool`: Binary score (True/False)
+    - `float`: Numeric score (0.0 to 1.0)
+    - `dict`: Full result with `key`, `score`, and optional `comment`
+
+    ---
+    🎯 USING OPENEVALS FOR PRE-BUILT EVALUATORS
+    -------------------------------------------
+
+    The `openevals` library provides pre-built evaluators that you can use out of the box.
+
+    1️⃣ **LLM-as-Judge Evaluators**
+
+    Use an LLM to judge your application's outputs. This is useful when you need subjective
+    evaluation or don't have reference outputs.
+
+    ```python
+    from openevals.llm import create_llm_as_judge
+    from openevals.prompts import CORRECTNESS_PROMPT, CONCISENESS_PROMPT
+
+    # Correctness evaluator (requires reference outputs)
+    correctness_evaluator = create_llm_as_judge(
+        prompt=CORRECTNESS_PROMPT,
+        feedback_key="correctness",
+        model="openai:o3-mini",
+    )
+
+    # Conciseness evaluator (no reference needed)
+    conciseness_evaluator = create_llm_as_judge(
+        prompt=CONCISENESS_PROMPT,
+        feedback_key="conciseness",
+        model="openai:o3-mini",
+    )
+
+    # Use with LangSmith evaluate
+    def wrapped_correctness_evaluator(inputs, outputs, reference_outputs):
+        return correctness_evaluator(
+            inputs=inputs,
+            outputs=outputs,
+            reference_outputs=reference_outputs
         )
 
-        # Use with LangSmith evaluate
-        def wrapped_correctness_evaluator(inputs, outputs, reference_outputs):
-            return correctness_evaluator(
+    results = ls_client.evaluate(
+        toxicity_classifier,
+        data=dataset.name,
+        evaluators=[wrapped_correctness_evaluator],
+    )
+    ```
+
+    **Pre-built Prompts Available:**
+    - `CORRECTNESS_PROMPT`: Evaluates correctness against reference outputs
+    - `CONCISENESS_PROMPT`: Evaluates how concise the output is
+    - `HALLUCINATION_PROMPT`: Checks for hallucinations (requires context)
+    - `RAG_HELPFULNESS_PROMPT`: For RAG applications
+    - `RAG_GROUNDEDNESS_PROMPT`: Checks if output is grounded in context
+    - `RAG_RETRIEVAL_RELEVANCE_PROMPT`: Evaluates retrieval quality
+
+    2️⃣ **Custom LLM-as-Judge with Custom Prompts**
+
+    You can create custom LLM-as-judge evaluators with your own prompts:
+
+    ```python
+    from openevals.llm import create_llm_as_judge
+
+    CUSTOM_PROMPT = '''
+    You are an expert evaluator. Rate the output quality on a scale of 0-1.
+
+    <input>
+    {inputs}
+    </input>
+
+    <output>
+    {outputs}
+    </output>
+
+    <reference>
+    {reference_outputs}
+    </reference>
+    '''
+
+    custom_evaluator = create_llm_as_judge(
+        prompt=CUSTOM_PROMPT,
+        feedback_key="quality",
+        model="openai:o3-mini",
+        continuous=True,  # Returns float (0.0-1.0) instead of boolean
+    )
+    ```
+
+    3️⃣ **Trajectory Evaluators for Multi-turn Conversations**
+
+    Trajectory evaluators evaluate entire conversation threads, useful for chat applications
+    and agents:
+
+    ```python
+    from openevals.llm import create_llm_as_judge
+
+    # Create a trajectory evaluator that looks at the full conversation
+    trajectory_evaluator = create_llm_as_judge(
+        model="openai:o3-mini",
+        prompt="Based on the below conversation, was the user satisfied?\\n{outputs}",
+        feedback_key="satisfaction",
+    )
+
+    # When using with evaluate, the outputs will be the full conversation trajectory
+    def wrapped_trajectory_evaluator(inputs, outputs, reference_outputs):
+        # outputs here will be a list of messages representing the conversation
+        return trajectory_evaluator(outputs=outputs)
+    ```
+
+    4️⃣ **Other Pre-built Evaluators**
+
+    OpenEvals also provides evaluators for:
+    - **Exact Match**: Compare outputs exactly
+    - **Embedding Similarity**: Compare using embeddings
+    - **Levenshtein Distance**: String similarity
+    - **Code Evaluators**: Type checking, execution (requires additional setup)
+
+    ```python
+    from openevals.exact import exact_match
+
+    # Simple exact match evaluator
+    def exact_match_evaluator(inputs, outputs, reference_outputs):
+        return exact_match(outputs=outputs, reference_outputs=reference_outputs)
+    ```
+
+    ---
+    📝 EVALUATOR WRAPPER PATTERN
+    -----------------------------
+    When using openevals evaluators with LangSmith's `evaluate()`, you may need to wrap them
+    to match the expected signature:
+
+    ```python
+    def wrap_openevals_evaluator(openevals_evaluator):
+        def wrapped(inputs, outputs, reference_outputs):
+            # openevals evaluators may have different parameter names
+            result = openevals_evaluator(
                 inputs=inputs,
                 outputs=outputs,
                 reference_outputs=reference_outputs
             )
+            return result
+        return wrapped
+
+    # Usage
+    wrapped_evaluator = wrap_openevals_evaluator(correctness_evaluator)
+    results = ls_client.evaluate(
+        app_function,
+        data=dataset.name,
+        evaluators=[wrapped_evaluator],
+    )
+    ```
+
+    ---
+    📤 RETURNS
+    ----------
+    None
+        This tool is documentation-only and returns None. The documentation is in the docstring.
+
+    ---
+    🧠 NOTES FOR AGENTS
+    --------------------
+    - This tool is **documentation-only** - it does not execute any code
+    - Use `evaluate()` for synchronous evaluation, `aevaluate()` for async (better for large jobs)
+    - Set `max_concurrency` to parallelize evaluation across multiple workers
+    - Custom evaluators can return bool, float, or dict with `key`, `score`, `comment`
+    - OpenEvals evaluators are pre-built and tested - use them when possible
+    - LLM-as-judge evaluators are flexible but cost money (API calls to judge model)
+    - Trajectory evaluators are useful for multi-turn conversations and agent evaluation
+    - Always ensure you have the required dependencies installed before using these patterns
+    - For agent-specific evaluations, consider using the `agentevals` package
+    - Evaluation results are stored as feedback in LangSmith and can be viewed in the UI
+    """  # noqa: W293
+    return None
+
+
+# Data-returning tools that can be dispatched through batch_execute
+_TOOL_REGISTRY: Dict[str, Callable[..., Dict[str, Any]]] = {
+    "list_prompts": list_prompts,
+    "get_prompt_by_name": get_prompt_by_name,
+    "fetch_runs": fetch_runs,
+    "list_projects": list_projects,
+    "list_experiments": list_experiments,
+    "list_datasets": list_datasets,
+    "list_examples": list_examples,
+    "read_dataset": read_dataset,
+    "read_example": read_example,
+}
+
+# All tools exposed by the server, in registration order
+_TOOLS = (
+    list_prompts,
+    get_prompt_by_name,
+    push_prompt,
+    fetch_runs,
+    list_projects,
+    list_experiments,
+    list_datasets,
+    list_examples,
+    read_dataset,
+    read_example,
+    batch_execute,
+    clear_caches,
+    create_dataset,
+    update_examples,
+    run_experiment,
+)
 
-        results = ls_client.evaluate(
-            toxicity_classifier,
-            data=dataset.name,
-            evaluators=[wrapped_correctness_evaluator],
-        )
-        ```
-
-        **Pre-built Prompts Available:**
-        - `CORRECTNESS_PROMPT`: Evaluates correctness against reference outputs
-        - `CONCISENESS_PROMPT`: Evaluates how concise the output is
-        - `HALLUCINATION_PROMPT`: Checks for hallucinations (requires context)
-        - `RAG_HELPFULNESS_PROMPT`: For RAG applications
-        - `RAG_GROUNDEDNESS_PROMPT`: Checks if output is grounded in context
-        - `RAG_RETRIEVAL_RELEVANCE_PROMPT`: Evaluates retrieval quality
-
-        2️⃣ **Custom LLM-as-Judge with Custom Prompts**
-
-        You can create custom LLM-as-judge evaluators with your own prompts:
-
-        ```python
-        from openevals.llm import create_llm_as_judge
-
-        CUSTOM_PROMPT = '''
-        You are an expert evaluator. Rate the output quality on a scale of 0-1.
-
-        <input>
-        {inputs}
-        </input>
-
-        <output>
-        {outputs}
-        </output>
-
-        <reference>
-        {reference_outputs}
-        </reference>
-        '''
 
-        custom_evaluator = create_llm_as_judge(
-            prompt=CUSTOM_PROMPT,
-            feedback_key="quality",
-            model="openai:o3-mini",
-            continuous=True,  # Returns float (0.0-1.0) instead of boolean
-        )
-        ```
+# Tools that call the LangSmith API; the documentation-only tools never need a client
+CLIENT_TOOLS: FrozenSet[str] = frozenset({*_TOOL_REGISTRY, "batch_execute", "clear_caches"})
 
-        3️⃣ **Trajectory Evaluators for Multi-turn Conversations**
 
-        Trajectory evaluators evaluate entire conversation threads, useful for chat applications
-        and agents:
+def _get_enabled_tools() -> Optional[FrozenSet[str]]:
+    """
+    Read the comma-separated LANGSMITH_MCP_ENABLED_TOOLS environment variable.
 
-        ```python
-        from openevals.llm import create_llm_as_judge
+    Returns None if the variable is not set, meaning all tools are enabled.
 
-        # Create a trajectory evaluator that looks at the full conversation
-        trajectory_evaluator = create_llm_as_judge(
-            model="openai:o3-mini",
-            prompt="Based on the below conversation, was the user satisfied?\\n{outputs}",
-            feedback_key="satisfaction",
+    Raises:
+        ValueError: If the variable names a tool that does not exist
+    """
+    value = os.environ.get("LANGSMITH_MCP_ENABLED_TOOLS")
+    if not value or not value.strip():
+        return None
+    enabled = frozenset(name.strip() for name in value.split(",") if name.strip())
+    unknown = enabled - {tool.__name__ for tool in _TOOLS}
+    if unknown:
+        raise ValueError(
+            f"Unknown tool(s) in LANGSMITH_MCP_ENABLED_TOOLS: {', '.join(sorted(unknown))}"
         )
+    return enabled
 
-        # When using with evaluate, the outputs will be the full conversation trajectory
-        def wrapped_trajectory_evaluator(inputs, outputs, reference_outputs):
-            # outputs here will be a list of messages representing the conversation
-            return trajectory_evaluator(outputs=outputs)
-        ```
 
-        4️⃣ **Other Pre-built Evaluators**
+def register_tools(mcp: FastMCP) -> None:
+    """
+    Register all LangSmith tool-related functionality with the MCP server.
+    This function configures and registers various tools for interacting with LangSmith,
+    including prompt management, conversation history, traces, and analytics.
 
-        OpenEvals also provides evaluators for:
-        - **Exact Match**: Compare outputs exactly
-        - **Embedding Similarity**: Compare using embeddings
-        - **Levenshtein Distance**: String similarity
-        - **Code Evaluators**: Type checking, execution (requires additional setup)
+    If LANGSMITH_MCP_ENABLED_TOOLS is set, only the listed tools are registered.
 
-        ```python
-        from openevals.exact import exact_match
+    Args:
+        mcp: The MCP server instance to register tools with
+    """
+    enabled_tools = _get_enabled_tools()
+    for tool in _TOOLS:
+        if enabled_tools is None or tool.__name__ in enabled_tools:
+            mcp.tool()(tool)
 
-        # Simple exact match evaluator
-        def exact_match_evaluator(inputs, outputs, reference_outputs):
-            return exact_match(outputs=outputs, reference_outputs=reference_outputs)
-        ```
 
-        ---
-        📝 EVALUATOR WRAPPER PATTERN
-        -----------------------------
-        When using openevals evaluators with LangSmith's `evaluate()`, you may need to wrap them
-        to match the expected signature:
+def unregister_tools(mcp: FastMCP, names: Iterable[str]) -> None:
+    """
+    Remove previously registered tools from the MCP server at runtime.
 
-        ```python
-        def wrap_openevals_evaluator(openevals_evaluator):
-            def wrapped(inputs, outputs, reference_outputs):
-                # openevals evaluators may have different parameter names
-                result = openevals_evaluator(
-                    inputs=inputs,
-                    outputs=outputs,
-                    reference_outputs=reference_outputs
-                )
-                return result
-            return wrapped
-
-        # Usage
-        wrapped_evaluator = wrap_openevals_evaluator(correctness_evaluator)
-        results = ls_client.evaluate(
-            app_function,
-            data=dataset.name,
-            evaluators=[wrapped_evaluator],
-        )
-        ```
+    Tools that are not currently registered are ignored.
 
-        ---
-        📤 RETURNS
-        ----------
-        None
-            This tool is documentation-only and returns None. The documentation is in the docstring.
-
-        ---
-        🧠 NOTES FOR AGENTS
-        --------------------
-        - This tool is **documentation-only** - it does not execute any code
-        - Use `evaluate()` for synchronous evaluation, `aevaluate()` for async (better for large jobs)
-        - Set `max_concurrency` to parallelize evaluation across multiple workers
-        - Custom evaluators can return bool, float, or dict with `key`, `score`, `comment`
-        - OpenEvals evaluators are pre-built and tested - use them when possible
-        - LLM-as-judge evaluators are flexible but cost money (API calls to judge model)
-        - Trajectory evaluators are useful for multi-turn conversations and agent evaluation
-        - Always ensure you have the required dependencies installed before using these patterns
-        - For agent-specific evaluations, consider using the `agentevals` package
-        - Evaluation results are stored as feedback in LangSmith and can be viewed in the UI
-        """  # noqa: W293
-        return None
+    Args:
+        mcp: The MCP server instance to remove tools from
+        names: Names of the tools to remove
+    """
+    for name in names:
+        try:
+            mcp.remove_tool(name)
+        except NotFoundError:
+            pass
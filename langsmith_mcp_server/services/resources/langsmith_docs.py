@@ -0,0 +1,14 @@
+"""LangSmith documentation exposed as MCP resources."""
+
+from functools import lru_cache
+from importlib import resources
+
+
+@lru_cache(maxsize=None)
+def fetch_runs_guide() -> str:
+    """
+    Filter Query Language (FQL) reference and usage examples for the fetch_runs tool.
+
+    The guide is read from the package on first access and cached afterwards.
+    """  # noqa: W293
+    return resources.files(__package__).joinpath("fetch_runs.md").read_text(encoding="utf-8")
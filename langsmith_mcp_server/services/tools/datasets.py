@@ -120,30 +120,24 @@ def list_examples_tool(
         Dictionary containing the examples and metadata
     """
     try:
-        # Prepare kwargs for the client call
-        kwargs = {}
-        if dataset_id is not None:
-            kwargs["dataset_id"] = dataset_id
-        if dataset_name is not None:
-            kwargs["dataset_name"] = dataset_name
-        if example_ids is not None:
-            kwargs["example_ids"] = example_ids
-        if metadata is not None:
-            kwargs["metadata"] = metadata
-        if splits is not None:
-            kwargs["splits"] = splits
-        if inline_s3_urls is not None:
-            kwargs["inline_s3_urls"] = inline_s3_urls
-        if include_attachments is not None:
-            kwargs["include_attachments"] = include_attachments
-        if as_of is not None:
-            kwargs["as_of"] = _parse_as_of_parameter(as_of)
-        if limit is not None:
-            kwargs["limit"] = limit
-        if offset is not None:
-            kwargs["offset"] = offset
-        if filter is not None:
-            kwargs["filter"] = filter
+        # Prepare kwargs for the client call, leaving out unset arguments
+        kwargs = {
+            name: value
+            for name, value in (
+                ("dataset_id", dataset_id),
+                ("dataset_name", dataset_name),
+                ("example_ids", example_ids),
+                ("metadata", metadata),
+                ("splits", splits),
+                ("inline_s3_urls", inline_s3_urls),
+                ("include_attachments", include_attachments),
+                ("as_of", _parse_as_of_parameter(as_of) if as_of is not None else None),
+                ("limit", limit),
+                ("offset", offset),
+                ("filter", filter),
+            )
+            if value is not None
+        }
 
         # Call the SDK
         examples = list(client.list_examples(**kwargs))
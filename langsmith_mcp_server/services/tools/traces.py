@@ -1,6 +1,7 @@
 """Tools for interacting with LangSmith traces and conversations."""
 
-from typing import Any, Dict, Iterable, List, Optional, Union
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 
 from langsmith import Client
 from langsmith.schemas import Run
@@ -243,27 +244,13 @@ def list_projects_tool(
         return {"projects": simple_projects}
 
 
-def fetch_runs_tool(
-    client: Client,
-    project_name: Union[str, List[str]],
-    trace_id: Optional[str] = None,
-    run_type: Optional[str] = None,
-    error: Optional[bool] = None,
-    is_root: Optional[bool] = None,
-    filter: Optional[str] = None,
-    trace_filter: Optional[str] = None,
-    tree_filter: Optional[str] = None,
-    order_by: str = "-start_time",
-    limit: int = 50,
-    reference_example_id: Optional[str] = None,
-) -> Dict[str, Any]:
+@dataclass(frozen=True, slots=True)
+class FetchRunsParams:
     """
-    Fetch LangSmith runs (traces, tools, chains, etc.) from one or more projects
-    using flexible filters, query language expressions, and trace-level constraints.
+    Parameters for fetching LangSmith runs, mirroring the arguments of Client.list_runs.
 
-    Args:
-        client: LangSmith client instance
-        project_name: The name of the project to fetch the runs from
+    Attributes:
+        project_name: The name of the project (or list of projects) to fetch the runs from
         trace_id: The ID of the trace to fetch the runs from
         run_type: The type of the run to fetch
         error: Whether to fetch errored runs
@@ -274,26 +261,61 @@ def fetch_runs_tool(
         order_by: The order by to apply to the runs
         limit: The limit to apply to the runs
         reference_example_id: The ID of the reference example to filter runs by
+    """
+
+    project_name: Union[str, List[str]]
+    trace_id: Optional[str] = None
+    run_type: Optional[str] = None
+    error: Optional[bool] = None
+    is_root: Optional[bool] = None
+    filter: Optional[str] = None
+    trace_filter: Optional[str] = None
+    tree_filter: Optional[str] = None
+    order_by: str = "-start_time"
+    limit: int = 50
+    reference_example_id: Optional[str] = None
+
+
+def iter_runs_tool(client: Client, params: FetchRunsParams) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily fetch LangSmith runs, yielding one JSON-serializable run dictionary at a time.
+
+    Runs are requested from the API page by page as the iterator is consumed.
+
+    Args:
+        client: LangSmith client instance
+        params: The run query parameters
+
     Returns:
-        Dictionary containing a "runs" key with a list of run dictionaries
+        Iterator of run dictionaries
     """
     runs_iter: Iterable[Run] = client.list_runs(
-        project_name=project_name,
-        trace_id=trace_id,
-        run_type=run_type,
-        error=error,
-        is_root=is_root,
-        filter=filter,
-        trace_filter=trace_filter,
-        tree_filter=tree_filter,
-        order_by=order_by,
-        limit=limit,
-        reference_example_id=reference_example_id,
+        project_name=params.project_name,
+        trace_id=params.trace_id,
+        run_type=params.run_type,
+        error=params.error,
+        is_root=params.is_root,
+        filter=params.filter,
+        trace_filter=params.trace_filter,
+        tree_filter=params.tree_filter,
+        order_by=params.order_by,
+        limit=params.limit,
+        reference_example_id=params.reference_example_id,
     )
-    runs_dict = []
     for run in runs_iter:
-        run_dict = run.dict()
         # Convert UUID objects to strings for JSON serialization
-        run_dict = convert_uuids_to_strings(run_dict)
-        runs_dict.append(run_dict)
-    return {"runs": runs_dict}
+        yield convert_uuids_to_strings(run.dict())
+
+
+def fetch_runs_tool(client: Client, params: FetchRunsParams) -> Dict[str, Any]:
+    """
+    Fetch LangSmith runs (traces, tools, chains, etc.) from one or more projects
+    using flexible filters, query language expressions, and trace-level constraints.
+
+    Args:
+        client: LangSmith client instance
+        params: The run query parameters
+    Returns:
+        Dictionary containing a "runs" key with a list of run dictionaries
+    """
+    return {"runs": list(iter_runs_tool(client, params))}
@@ -0,0 +1,130 @@
+"""Tests for common helper functions."""
+
+import base64
+import json
+import os
+import sys
+from unittest.mock import Mock, patch
+
+import pytest
+
+from langsmith_mcp_server.common.helpers import (
+    _clear_client_cache,
+    _client_cache,
+    _get_cached_client,
+    client_context,
+    get_client_from_context,
+    pack_msgpack_response,
+    pack_zstd_response,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    """Make sure every test starts with an empty client cache."""
+    _clear_client_cache()
+    yield
+    _clear_client_cache()
+
+
+@pytest.fixture
+def stdio_context(monkeypatch):
+    """Create a mock FastMCP context without session state or HTTP request."""
+    monkeypatch.setenv("LANGSMITH_API_KEY", "lsv2_test_key")
+    monkeypatch.delenv("LANGSMITH_WORKSPACE_ID", raising=False)
+    monkeypatch.delenv("LANGSMITH_ENDPOINT", raising=False)
+    ctx = Mock()
+    ctx.get_state.return_value = None
+    ctx.get_http_request.side_effect = RuntimeError("No active HTTP request")
+    return ctx
+
+
+class TestGetClientFromContext:
+    """Tests for get_client_from_context."""
+
+    def test_client_is_reused(self, stdio_context):
+        with patch("langsmith_mcp_server.common.helpers.Client") as client_cls:
+            first = get_client_from_context(stdio_context)
+            second = get_client_from_context(stdio_context)
+
+        assert first is second
+        client_cls.assert_called_once_with(api_key="lsv2_test_key")
+
+    def test_client_per_configuration(self, stdio_context, monkeypatch):
+        with patch("langsmith_mcp_server.common.helpers.Client", side_effect=lambda **kw: Mock()):
+            first = get_client_from_context(stdio_context)
+            monkeypatch.setenv("LANGSMITH_API_KEY", "lsv2_other_key")
+            second = get_client_from_context(stdio_context)
+
+        assert first is not second
+
+    def test_environment_is_set_on_cache_hit(self, monkeypatch):
+        # Restore the environment variables _get_cached_client sets after the test
+        monkeypatch.setenv("LANGSMITH_API_KEY", "")
+        monkeypatch.setenv("LANGSMITH_ENDPOINT", "")
+        with patch("langsmith_mcp_server.common.helpers.Client", side_effect=lambda **kw: Mock()):
+            first = _get_cached_client("lsv2_key_a", endpoint="https://a.example.com")
+            _get_cached_client("lsv2_key_b", endpoint="https://b.example.com")
+            again = _get_cached_client("lsv2_key_a", endpoint="https://a.example.com")
+
+        assert again is first
+        assert os.environ["LANGSMITH_API_KEY"] == "lsv2_key_a"
+        assert os.environ["LANGSMITH_ENDPOINT"] == "https://a.example.com"
+
+    def test_cache_does_not_hold_api_keys(self, monkeypatch):
+        monkeypatch.setenv("LANGSMITH_API_KEY", "")
+        with patch("langsmith_mcp_server.common.helpers.Client", side_effect=lambda **kw: Mock()):
+            _get_cached_client("lsv2_secret_key")
+
+        assert all("lsv2_secret_key" not in key for key in _client_cache)
+
+    def test_client_from_context_var(self, stdio_context):
+        client = Mock()
+        token = client_context.set(client)
+        try:
+            assert get_client_from_context(stdio_context) is client
+        finally:
+            client_context.reset(token)
+        stdio_context.get_state.assert_not_called()
+
+    def test_missing_api_key(self, stdio_context, monkeypatch):
+        monkeypatch.delenv("LANGSMITH_API_KEY")
+        with pytest.raises(ValueError, match="API key not found"):
+            get_client_from_context(stdio_context)
+
+
+class TestPackMsgpackResponse:
+    """Tests for pack_msgpack_response."""
+
+    def test_round_trip(self):
+        msgpack = pytest.importorskip("msgpack")
+        result = {"runs": [{"id": "run-1", "inputs": {"question": "What is 2+2?"}}]}
+
+        packed = pack_msgpack_response(result)
+
+        assert list(packed) == ["_binary_msgpack"]
+        assert msgpack.unpackb(base64.b64decode(packed["_binary_msgpack"])) == result
+
+    def test_missing_msgpack(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "msgpack", None)
+        with pytest.raises(ValueError, match="msgpack"):
+            pack_msgpack_response({"runs": []})
+
+
+class TestPackZstdResponse:
+    """Tests for pack_zstd_response."""
+
+    def test_round_trip(self):
+        zstandard = pytest.importorskip("zstandard")
+        result = {"runs": [{"id": "run-1", "outputs": {"text": "hello " * 100}}]}
+
+        packed = pack_zstd_response(result)
+
+        blob = base64.b64decode(packed["_zstd_b64"])
+        assert json.loads(zstandard.ZstdDecompressor().decompress(blob)) == result
+        assert len(blob) < len(json.dumps(result))
+
+    def test_missing_zstandard(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "zstandard", None)
+        with pytest.raises(ValueError, match="zstandard"):
+            pack_zstd_response({"runs": []})
@@ -0,0 +1,104 @@
+"""Tests for the tool argument parsers."""
+
+import pytest
+
+from langsmith_mcp_server.common.parsers import (
+    parse_bool,
+    parse_flag,
+    parse_json_array,
+    parse_json_obj,
+)
+
+
+class TestParseBool:
+    """Tests for parse_bool."""
+
+    @pytest.mark.parametrize("value", ["true", "True", "TRUE", "tRuE", "1", "yes", "Yes"])
+    def test_true_values(self, value):
+        assert parse_bool(value) is True
+
+    @pytest.mark.parametrize("value", ["false", "False", "FALSE", "0", "no"])
+    def test_false_values(self, value):
+        assert parse_bool(value) is False
+
+    def test_none(self):
+        assert parse_bool(None) is None
+
+    def test_unrecognized(self):
+        assert parse_bool("maybe") is None
+
+
+class TestParseFlag:
+    """Tests for parse_flag."""
+
+    def test_values(self):
+        assert parse_flag("true") is True
+        assert parse_flag("false") is False
+        assert parse_flag("maybe") is False
+        assert parse_flag(None) is None
+
+
+class TestParseJsonArray:
+    """Tests for parse_json_array."""
+
+    def test_json_array(self):
+        assert parse_json_array('["id1", "id2"]') == ["id1", "id2"]
+
+    def test_single_value(self):
+        assert parse_json_array("id1") == ["id1"]
+
+    def test_single_uuid(self):
+        uuid = "3f1c2d4e-1111-2222-3333-444455556666"
+        assert parse_json_array(uuid) == [uuid]
+
+    def test_uuid_shaped_json_array(self):
+        value = '["abcdef-abcd-efgh", "x", "y123456"]'
+        assert len(value) == 36
+        assert parse_json_array(value) == ["abcdef-abcd-efgh", "x", "y123456"]
+
+    def test_uuid_shaped_whitespace_prefixed_json_array(self):
+        value = ' ["abcde-fghi-jk", "lmnopqrstuvwxy"]'
+        assert len(value) == 36
+        assert parse_json_array(value) == ["abcde-fghi-jk", "lmnopqrstuvwxy"]
+
+    def test_list_passthrough(self):
+        assert parse_json_array(["id1", "id2"]) == ["id1", "id2"]
+        assert parse_json_array([]) is None
+
+    def test_invalid_json_array(self):
+        assert parse_json_array("[not json") == ["[not json"]
+
+    def test_whitespace_prefixed_json_array(self):
+        assert parse_json_array('  ["id1", "id2"]') == ["id1", "id2"]
+
+    def test_json_scalar_is_kept_as_string(self):
+        assert parse_json_array("123") == ["123"]
+        assert parse_json_array('"train"') == ['"train"']
+
+    def test_empty(self):
+        assert parse_json_array(None) is None
+        assert parse_json_array("") is None
+
+
+class TestParseJsonObj:
+    """Tests for parse_json_obj."""
+
+    def test_json_object(self):
+        assert parse_json_obj('{"key": "value"}') == {"key": "value"}
+
+    def test_dict_passthrough(self):
+        value = {"key": "value"}
+        assert parse_json_obj(value) is value
+
+    def test_not_an_object(self):
+        assert parse_json_obj("value") is None
+        assert parse_json_obj('["value"]') is None
+
+    def test_whitespace_prefixed_json_object(self):
+        assert parse_json_obj(' {"key": "value"}') == {"key": "value"}
+
+    def test_invalid_json_object(self):
+        assert parse_json_obj("{not json") is None
+
+    def test_empty(self):
+        assert parse_json_obj(None) is None
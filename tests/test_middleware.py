@@ -0,0 +1,90 @@
+"""Tests for the LangSmith client middleware."""
+
+from unittest.mock import Mock, patch
+
+from fastmcp import Client, FastMCP
+from fastmcp.server import Context
+
+from langsmith_mcp_server.common.helpers import _clear_client_cache, client_context
+from langsmith_mcp_server.middleware import LangSmithClientMiddleware
+
+
+async def test_client_is_set_for_tool_call(monkeypatch):
+    monkeypatch.setenv("LANGSMITH_API_KEY", "lsv2_test_key")
+    _clear_client_cache()
+
+    mcp = FastMCP("test")
+    mcp.add_middleware(LangSmithClientMiddleware())
+
+    @mcp.tool()
+    def has_client(ctx: Context = None) -> bool:
+        return client_context.get() is not None
+
+    with patch("langsmith_mcp_server.common.helpers.Client", return_value=Mock()):
+        async with Client(mcp) as client:
+            result = await client.call_tool("has_client", {})
+
+    _clear_client_cache()
+    assert result.data is True
+    assert client_context.get() is None
+
+
+async def test_missing_api_key_is_left_to_the_tool(monkeypatch):
+    monkeypatch.delenv("LANGSMITH_API_KEY", raising=False)
+
+    mcp = FastMCP("test")
+    mcp.add_middleware(LangSmithClientMiddleware())
+
+    @mcp.tool()
+    def has_client(ctx: Context = None) -> bool:
+        return client_context.get() is not None
+
+    async with Client(mcp) as client:
+        result = await client.call_tool("has_client", {})
+
+    assert result.data is False
+
+
+async def test_client_errors_are_left_to_the_tool(monkeypatch):
+    monkeypatch.setenv("LANGSMITH_API_KEY", "lsv2_test_key")
+    _clear_client_cache()
+
+    mcp = FastMCP("test")
+    mcp.add_middleware(LangSmithClientMiddleware())
+
+    @mcp.tool()
+    def has_client(ctx: Context = None) -> bool:
+        return client_context.get() is not None
+
+    with patch("langsmith_mcp_server.common.helpers.Client", side_effect=RuntimeError("boom")):
+        async with Client(mcp) as client:
+            result = await client.call_tool("has_client", {})
+
+    _clear_client_cache()
+    assert result.data is False
+
+
+async def test_client_is_only_resolved_for_listed_tools(monkeypatch):
+    monkeypatch.setenv("LANGSMITH_API_KEY", "lsv2_test_key")
+    _clear_client_cache()
+
+    mcp = FastMCP("test")
+    mcp.add_middleware(LangSmithClientMiddleware(tool_names={"needs_client"}))
+
+    @mcp.tool()
+    def needs_client(ctx: Context = None) -> bool:
+        return client_context.get() is not None
+
+    @mcp.tool()
+    def docs_only(ctx: Context = None) -> bool:
+        return client_context.get() is not None
+
+    with patch("langsmith_mcp_server.common.helpers.Client", return_value=Mock()) as client_cls:
+        async with Client(mcp) as client:
+            docs = await client.call_tool("docs_only", {})
+            client_cls.assert_not_called()
+            needs = await client.call_tool("needs_client", {})
+
+    _clear_client_cache()
+    assert docs.data is False
+    assert needs.data is True
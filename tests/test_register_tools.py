@@ -0,0 +1,641 @@
+"""Tests for the MCP tool wrappers and their registration."""
+
+import asyncio
+import datetime
+import importlib
+import io
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+from fastmcp import Client as FastMCPClient
+from fastmcp import FastMCP
+from fastmcp.server import Context
+from langsmith import schemas
+
+from langsmith_mcp_server.common.helpers import _clear_client_cache, client_context
+from langsmith_mcp_server.middleware import LangSmithClientMiddleware
+from langsmith_mcp_server.services.register_tools import (
+    _execute_batch,
+    register_tools,
+    unregister_tools,
+)
+
+
+@pytest.fixture
+def rt():
+    """The register_tools module, whose names the tests patch with monkeypatch."""
+    return importlib.import_module("langsmith_mcp_server.services.register_tools")
+
+
+@pytest.fixture
+def captured_list_examples(rt, monkeypatch):
+    """Replace list_examples_tool with a fake and return the arguments it was called with."""
+    captured = {}
+
+    def fake_list_examples(client, **kwargs):
+        captured.update(kwargs)
+        return {"examples": []}
+
+    monkeypatch.setattr(rt, "get_client_from_context", lambda ctx: object())
+    monkeypatch.setattr(rt, "list_examples_tool", fake_list_examples)
+    return captured
+
+
+@pytest.fixture
+def tool_registry(rt, monkeypatch):
+    """Replace the batch tool registry with simple fake tools."""
+
+    def echo(value: int, ctx=None):
+        return {"value": value}
+
+    def fail(ctx=None):
+        return {"error": "boom"}
+
+    registry = {"echo": echo, "fail": fail}
+    monkeypatch.setattr(rt, "_TOOL_REGISTRY", registry)
+    return registry
+
+
+class TestExecuteBatch:
+    """Tests for _execute_batch."""
+
+    async def test_results_in_order(self, tool_registry):
+        operations = [
+            {"tool": "echo", "args": {"value": 1}},
+            {"tool": "echo", "args": {"value": "2"}},
+        ]
+        result = await _execute_batch(operations, max_concurrent=2, stop_on_error=False, ctx=None)
+        assert result == {
+            "results": [
+                {"tool": "echo", "result": {"value": 1}},
+                {"tool": "echo", "result": {"value": 2}},
+            ]
+        }
+
+    async def test_errors_are_reported_per_operation(self, tool_registry):
+        operations = [
+            {"tool": "fail"},
+            {"tool": "missing"},
+            {"tool": "echo", "args": {"value": "not-an-int"}},
+            {"tool": "echo", "args": {"value": 3}},
+        ]
+        result = await _execute_batch(operations, max_concurrent=4, stop_on_error=False, ctx=None)
+        results = result["results"]
+        assert results[0] == {"tool": "fail", "error": "boom"}
+        assert results[1] == {"tool": "missing", "error": "Unknown tool: missing"}
+        assert "error" in results[2]
+        assert results[3] == {"tool": "echo", "result": {"value": 3}}
+
+    async def test_stop_on_error_skips_remaining(self, tool_registry):
+        operations = [{"tool": "fail"}, {"tool": "echo", "args": {"value": 1}}]
+        result = await _execute_batch(operations, max_concurrent=1, stop_on_error=True, ctx=None)
+        assert result["results"][0] == {"tool": "fail", "error": "boom"}
+        assert result["results"][1]["error"] == "Skipped because an earlier operation failed"
+
+
+class TestRegisterTools:
+    """Tests for register_tools and unregister_tools."""
+
+    async def test_registers_all_tools_by_default(self, monkeypatch):
+        monkeypatch.delenv("LANGSMITH_MCP_ENABLED_TOOLS", raising=False)
+        mcp = FastMCP("test")
+        register_tools(mcp)
+        tools = await mcp.get_tools()
+        assert "fetch_runs" in tools
+        assert "batch_execute" in tools
+
+    async def test_enabled_tools_env(self, monkeypatch):
+        monkeypatch.setenv("LANGSMITH_MCP_ENABLED_TOOLS", "fetch_runs, list_projects")
+        mcp = FastMCP("test")
+        register_tools(mcp)
+        assert set(await mcp.get_tools()) == {"fetch_runs", "list_projects"}
+
+    def test_unknown_enabled_tool_raises(self, monkeypatch):
+        monkeypatch.setenv("LANGSMITH_MCP_ENABLED_TOOLS", "fetch_runs,not_a_tool")
+        with pytest.raises(ValueError, match="not_a_tool"):
+            register_tools(FastMCP("test"))
+
+    async def test_unregister_tools(self, monkeypatch):
+        monkeypatch.setenv("LANGSMITH_MCP_ENABLED_TOOLS", "fetch_runs,list_projects")
+        mcp = FastMCP("test")
+        register_tools(mcp)
+        unregister_tools(mcp, ["list_projects", "read_example"])
+        assert set(await mcp.get_tools()) == {"fetch_runs"}
+
+
+class TestFetchRuns:
+    """Tests for the fetch_runs tool wrapper."""
+
+    async def test_parses_string_arguments(self, rt, monkeypatch):
+        captured = {}
+
+        def fake_iter_runs(client, params):
+            captured["params"] = params
+            return iter([{"id": "run-1"}])
+
+        monkeypatch.setattr(rt, "get_client_from_context", lambda ctx: object())
+        monkeypatch.setattr(rt, "iter_runs_tool", fake_iter_runs)
+
+        result = await rt.fetch_runs(project_name='["a", "b"]', error="true", is_root="False")
+
+        assert result == {"runs": [{"id": "run-1"}]}
+        params = captured["params"]
+        assert params.project_name == ["a", "b"]
+        assert params.error is True
+        assert params.is_root is False
+
+    async def test_rejects_compress_with_msgpack(self, rt, monkeypatch):
+        monkeypatch.setattr(rt, "get_client_from_context", lambda ctx: object())
+
+        result = await rt.fetch_runs(project_name="a", response_format="msgpack", compress="zstd")
+
+        assert result == {"error": "compress is only supported with response_format 'json'"}
+
+    async def test_msgpack_is_packed_off_the_event_loop(self, rt, monkeypatch):
+        threads = []
+
+        def fake_pack(result):
+            threads.append(threading.get_ident())
+            return {"_binary_msgpack": ""}
+
+        monkeypatch.setattr(rt, "get_client_from_context", lambda ctx: object())
+        monkeypatch.setattr(rt, "iter_runs_tool", lambda client, params: iter([]))
+        monkeypatch.setattr(rt, "pack_msgpack_response", fake_pack)
+
+        result = await rt.fetch_runs(project_name="a", response_format="msgpack")
+
+        assert result == {"_binary_msgpack": ""}
+        assert len(threads) == 1
+        assert threads[0] != threading.get_ident()
+
+    async def test_identical_concurrent_calls_share_one_fetch(self, rt, monkeypatch):
+        calls = []
+
+        def fake_iter_runs(client, params):
+            calls.append(params)
+            return iter([{"id": "run-1"}])
+
+        monkeypatch.setattr(rt, "get_client_from_context", lambda ctx: "client")
+        monkeypatch.setattr(rt, "iter_runs_tool", fake_iter_runs)
+
+        results = await asyncio.gather(
+            rt.fetch_runs(project_name='["a", "b"]', limit=5),
+            rt.fetch_runs(project_name='["a", "b"]', limit=5),
+            rt.fetch_runs(project_name='["a", "b"]', limit=10),
+        )
+
+        assert results[0] == results[1] == results[2] == {"runs": [{"id": "run-1"}]}
+        assert len(calls) == 2
+        assert rt._INFLIGHT_RUNS == {}
+
+    async def test_progress_is_reported_to_each_caller(self, rt, monkeypatch):
+
+        class FakeContext:
+            def __init__(self, fail=False):
+                self.fail = fail
+                self.progress = []
+
+            async def report_progress(self, progress, total=None):
+                if self.fail:
+                    raise RuntimeError("disconnected")
+                self.progress.append((progress, total))
+
+        def fake_iter_runs(client, params):
+            return iter([{"id": "run-1"}, {"id": "run-2"}])
+
+        monkeypatch.setattr(rt, "_RUNS_PAGE_SIZE", 1)
+        monkeypatch.setattr(rt, "get_client_from_context", lambda ctx: "client")
+        monkeypatch.setattr(rt, "iter_runs_tool", fake_iter_runs)
+
+        leader, follower = FakeContext(fail=True), FakeContext()
+        results = await asyncio.gather(
+            rt.fetch_runs(project_name="a", limit=2, ctx=leader),
+            rt.fetch_runs(project_name="a", limit=2, ctx=follower),
+        )
+
+        # A failing progress notification only fails its own call, not the shared fetch
+        assert results[0] == {"error": "disconnected"}
+        assert results[1] == {"runs": [{"id": "run-1"}, {"id": "run-2"}]}
+        assert follower.progress == [(1, 2), (2, 2)]
+        assert rt._INFLIGHT_RUNS == {}
+
+    async def test_progress_is_sent_to_each_client(self, rt, monkeypatch):
+
+        def fake_iter_runs(client, params):
+            for i in range(3):
+                time.sleep(0.05)
+                yield {"id": f"run-{i}"}
+
+        monkeypatch.setattr(rt, "_RUNS_PAGE_SIZE", 1)
+        monkeypatch.setattr(rt, "get_client_from_context", lambda ctx: "client")
+        monkeypatch.setattr(rt, "iter_runs_tool", fake_iter_runs)
+
+        mcp = FastMCP("test")
+        mcp.tool()(rt.fetch_runs)
+
+        async def call(progress):
+            async def handler(value, total, message):
+                progress.append(value)
+
+            async with FastMCPClient(mcp) as client:
+                await client.call_tool(
+                    "fetch_runs", {"project_name": "a", "limit": 3}, progress_handler=handler
+                )
+
+        first, second = [], []
+        await asyncio.gather(call(first), call(second))
+
+        # Each client gets increasing progress of its own; the second one may have joined
+        # after the first page
+        assert first == [1, 2, 3]
+        assert second == sorted(set(second))
+        assert second[-1] == 3
+
+    async def test_nested_list_arguments(self, rt, monkeypatch):
+        monkeypatch.setattr(rt, "get_client_from_context", lambda ctx: "client")
+        monkeypatch.setattr(rt, "iter_runs_tool", lambda client, params: iter([{"id": "run-1"}]))
+
+        result = await rt.fetch_runs(project_name='[["a"], {"b": 1}]')
+
+        assert result == {"runs": [{"id": "run-1"}]}
+
+    async def test_fetch_is_cancelled_without_callers(self, rt, monkeypatch):
+        started, release = threading.Event(), threading.Event()
+
+        def fake_iter_runs(client, params):
+            started.set()
+            release.wait(5)
+            yield {"id": "run-1"}
+
+        monkeypatch.setattr(rt, "get_client_from_context", lambda ctx: "client")
+        monkeypatch.setattr(rt, "iter_runs_tool", fake_iter_runs)
+
+        caller = asyncio.create_task(rt.fetch_runs(project_name="a"))
+        await asyncio.to_thread(started.wait, 5)
+        ((shared, _),) = rt._INFLIGHT_RUNS.values()
+        caller.cancel()
+        release.set()
+
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        with pytest.raises(asyncio.CancelledError):
+            await shared
+        await asyncio.sleep(0)  # let the done callback drop the entry
+        assert rt._INFLIGHT_RUNS == {}
+
+    async def test_batched_fetches_do_not_report_progress(self, rt, monkeypatch):
+        reported = []
+
+        async def fake_report_progress(self, progress, total=None, message=None):
+            reported.append((progress, total))
+
+        def fake_iter_runs(client, params):
+            return iter([{"id": "run-1"}, {"id": "run-2"}])
+
+        monkeypatch.setattr(rt, "_RUNS_PAGE_SIZE", 1)
+        monkeypatch.setattr(rt, "get_client_from_context", lambda ctx: "client")
+        monkeypatch.setattr(rt, "iter_runs_tool", fake_iter_runs)
+        monkeypatch.setattr(Context, "report_progress", fake_report_progress)
+
+        mcp = FastMCP("test")
+        mcp.tool()(rt.fetch_runs)
+        operations = [
+            {"tool": "fetch_runs", "args": {"project_name": "a", "limit": 2}},
+            {"tool": "fetch_runs", "args": {"project_name": "b", "limit": 2}},
+        ]
+        result = await _execute_batch(
+            operations, max_concurrent=2, stop_on_error=False, ctx=Context(mcp)
+        )
+
+        assert [entry["result"]["runs"] for entry in result["results"]] == [
+            [{"id": "run-1"}, {"id": "run-2"}]
+        ] * 2
+        assert reported == []
+
+
+class TestReadGuards:
+    """Tests for the precondition checks in read_dataset and read_example."""
+
+    @pytest.fixture(autouse=True)
+    def no_client(self, rt, monkeypatch):
+
+        def fail(ctx):
+            raise AssertionError("client should not be resolved")
+
+        monkeypatch.setattr(rt, "get_client_from_context", fail)
+        return rt
+
+    def test_read_dataset_requires_id_or_name(self, no_client):
+        assert no_client.read_dataset() == {
+            "error": "Error: Either dataset_id or dataset_name must be provided."
+        }
+
+    def test_read_example_requires_id(self, no_client):
+        assert no_client.read_example(example_id="") == {
+            "error": "Error: example_id must be provided."
+        }
+
+
+class FakeClient:
+    """Stand-in for a LangSmith client with a configuration of its own."""
+
+    def __init__(self):
+        self.api_key = f"lsv2_{uuid.uuid4().hex}"
+        self.workspace_id = None
+        self.api_url = "https://api.smith.langchain.com"
+
+
+class TestReadExampleCache:
+    """Tests for caching read_example results with a fixed as_of."""
+
+    @pytest.fixture
+    def calls(self):
+        return []
+
+    @pytest.fixture
+    def rt(self, rt, monkeypatch, calls):
+        client = FakeClient()
+
+        def fake_read_example(client, example_id, as_of=None):
+            calls.append((example_id, as_of))
+            if example_id == "missing":
+                return {"error": "not found"}
+            return {"example": {"id": example_id}}
+
+        monkeypatch.setattr(rt, "get_client_from_context", lambda ctx: client)
+        monkeypatch.setattr(rt, "read_example_tool", fake_read_example)
+        rt.clear_caches()
+        yield rt
+        rt.clear_caches()
+
+    @pytest.mark.parametrize(
+        "as_of, fixed",
+        [
+            ("2024-01-01T00:00:00Z", True),
+            ("2024-01-01T00:00:00", True),
+            ("2999-01-01T00:00:00Z", False),
+            ("latest", False),
+            (None, False),
+        ],
+    )
+    def test_is_fixed_as_of(self, rt, as_of, fixed):
+        assert rt._is_fixed_as_of(as_of) is fixed
+
+    def test_fixed_as_of_is_cached(self, rt, calls):
+        first = rt.read_example("ex-1", as_of="2024-01-01T00:00:00Z")
+        second = rt.read_example("ex-1", as_of="2024-01-01T00:00:00Z")
+        assert first == second == {"example": {"id": "ex-1"}}
+        assert len(calls) == 1
+
+    def test_version_tag_is_not_cached(self, rt, calls):
+        rt.read_example("ex-1", as_of="latest")
+        rt.read_example("ex-1", as_of="latest")
+        assert len(calls) == 2
+
+    def test_errors_are_not_cached(self, rt, calls):
+        rt.read_example("missing", as_of="2024-01-01T00:00:00Z")
+        rt.read_example("missing", as_of="2024-01-01T00:00:00Z")
+        assert len(calls) == 2
+
+    def test_clear_caches(self, rt, calls):
+        rt.read_example("ex-1", as_of="2024-01-01T00:00:00Z")
+        assert rt.clear_caches() == {"cleared": 1}
+        rt.read_example("ex-1", as_of="2024-01-01T00:00:00Z")
+        assert len(calls) == 2
+
+    def test_recreated_client_shares_cache(self, rt, calls, monkeypatch):
+        rt.read_example("ex-1", as_of="2024-01-01T00:00:00Z")
+        # A new client for the same configuration, e.g. after eviction from the client cache
+        recreated = FakeClient()
+        recreated.api_key = rt.get_client_from_context(None).api_key
+        monkeypatch.setattr(rt, "get_client_from_context", lambda ctx: recreated)
+
+        rt.read_example("ex-1", as_of="2024-01-01T00:00:00Z")
+        assert len(calls) == 1
+        assert rt.clear_caches() == {"cleared": 1}
+
+    def test_clear_caches_only_clears_own_client(self, rt, calls, monkeypatch):
+        rt.read_example("ex-1", as_of="2024-01-01T00:00:00Z")
+        with monkeypatch.context() as m:
+            m.setattr(rt, "get_client_from_context", lambda ctx: FakeClient())
+            assert rt.clear_caches() == {"cleared": 0}
+
+        rt.read_example("ex-1", as_of="2024-01-01T00:00:00Z")
+        assert len(calls) == 1
+
+
+class TestReadExampleSingleFlight:
+    """Tests for sharing concurrent identical read_example requests."""
+
+    def test_concurrent_calls_share_one_request(self, rt, monkeypatch):
+        client = FakeClient()
+        release = threading.Event()
+        calls = []
+
+        def fake_read_example(client, example_id, as_of=None):
+            calls.append(example_id)
+            release.wait(timeout=5)
+            return {"example": {"id": example_id}}
+
+        monkeypatch.setattr(rt, "read_example_tool", fake_read_example)
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            leader = pool.submit(rt._read_example_single_flight, client, "ex-1", None)
+            while not rt._INFLIGHT_EXAMPLES:
+                time.sleep(0.001)
+            followers = [
+                pool.submit(rt._read_example_single_flight, client, "ex-1", None) for _ in range(2)
+            ]
+            # Give the followers time to start waiting on the in-flight request
+            time.sleep(0.05)
+            release.set()
+            results = [leader.result()] + [f.result() for f in followers]
+
+        assert results == [{"example": {"id": "ex-1"}}] * 3
+        assert calls == ["ex-1"]
+        assert rt._INFLIGHT_EXAMPLES == {}
+
+
+class TestPrefetchExamples:
+    """Tests for coalescing read_example operations in batch_execute."""
+
+    @pytest.fixture
+    def list_calls(self, rt, monkeypatch):
+        calls = []
+
+        def fake_list_examples(client, example_ids=None, as_of=None, **kwargs):
+            calls.append((example_ids, as_of))
+            return {"examples": [{"id": i} for i in example_ids if i != "missing"]}
+
+        def fake_read_example(client, example_id, as_of=None):
+            return {"error": f"not found: {example_id}"}
+
+        monkeypatch.setattr(rt, "get_client_from_context", lambda ctx: FakeClient())
+        monkeypatch.setattr(rt, "list_examples_tool", fake_list_examples)
+        monkeypatch.setattr(rt, "read_example_tool", fake_read_example)
+        return calls
+
+    @pytest.fixture
+    def ctx(self, rt):
+        mcp = FastMCP("test")
+        mcp.tool()(rt.read_example)
+        # Context only holds a weak reference to the server, so keep it alive here
+        yield Context(mcp)
+
+    async def test_read_examples_are_coalesced(self, list_calls, ctx):
+        operations = [
+            {"tool": "read_example", "args": {"example_id": "ex-1"}},
+            {"tool": "read_example", "args": {"example_id": "ex-2"}},
+            {"tool": "read_example", "args": {"example_id": "ex-1"}},
+            {"tool": "read_example", "args": {"example_id": "missing"}},
+        ]
+        result = await _execute_batch(operations, max_concurrent=4, stop_on_error=False, ctx=ctx)
+
+        assert list_calls == [(["ex-1", "ex-2", "missing"], None)]
+        results = result["results"]
+        assert results[0] == {"tool": "read_example", "result": {"example": {"id": "ex-1"}}}
+        assert results[1] == {"tool": "read_example", "result": {"example": {"id": "ex-2"}}}
+        assert results[2] == results[0]
+        # Examples missing from the bulk response fall back to read_example
+        assert results[3] == {"tool": "read_example", "error": "not found: missing"}
+
+    async def test_single_read_example_is_not_coalesced(self, list_calls, ctx):
+        operations = [{"tool": "read_example", "args": {"example_id": "ex-1"}}]
+        await _execute_batch(operations, max_concurrent=1, stop_on_error=False, ctx=ctx)
+        assert list_calls == []
+
+
+class TestPrefetchExamplesPayload:
+    """Tests that prefetched examples match individual read_example results."""
+
+    async def test_matches_read_example_tool(self, rt, monkeypatch):
+        example_ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+        readers = {example_id: io.BytesIO(b"") for example_id in example_ids}
+
+        class FakeSDKClient:
+            """Mimics which fields the SDK fills in for read_example and list_examples."""
+
+            def make_example(self, example_id, include_attachments):
+                attachment = {
+                    "presigned_url": f"https://s3/{example_id}",
+                    "mime_type": "text/plain",
+                    "reader": readers[example_id],
+                }
+                attachments = {"file": attachment}
+                return schemas.Example(
+                    id=example_id,
+                    dataset_id=uuid.UUID(int=0),
+                    inputs={"q": example_id},
+                    created_at=datetime.datetime(2024, 1, 1),
+                    attachments=attachments if include_attachments else {},
+                )
+
+            def read_example(self, example_id):
+                return self.make_example(example_id, include_attachments=True)
+
+            def list_examples(self, example_ids, include_attachments=False, **kwargs):
+                return [self.make_example(i, include_attachments) for i in example_ids]
+
+        client = FakeSDKClient()
+        monkeypatch.setattr(rt, "get_client_from_context", lambda ctx: client)
+
+        operations = [
+            {"tool": "read_example", "args": {"example_id": example_id}}
+            for example_id in example_ids
+        ]
+        prefetched = await rt._prefetch_examples(operations, ctx=None)
+
+        for example_id in example_ids:
+            assert prefetched[(example_id, None)] == rt.read_example_tool(client, example_id)
+
+
+class TestListExamples:
+    """Tests for the list_examples tool wrapper."""
+
+    def test_parses_and_drops_unset_arguments(self, rt, captured_list_examples):
+        rt.list_examples(
+            dataset_name="ds",
+            splits='["train"]',
+            metadata='{"k": "v"}',
+            include_attachments="TRUE",
+            offset=5,
+        )
+
+        assert captured_list_examples == {
+            "dataset_name": "ds",
+            "splits": ["train"],
+            "metadata": {"k": "v"},
+            "include_attachments": True,
+            "limit": 10,
+            "offset": 5,
+        }
+
+    def test_accepts_metadata_dict(self, rt, captured_list_examples):
+        rt.list_examples(dataset_name="ds", metadata={"k": "v"})
+
+        assert captured_list_examples["metadata"] == {"k": "v"}
+
+    def test_fast_path_without_parsed_arguments(self, rt, captured_list_examples):
+        assert rt.list_examples(dataset_id="ds-1") == {"examples": []}
+        assert captured_list_examples == {
+            "dataset_id": "ds-1",
+            "dataset_name": None,
+            "filter": None,
+            "as_of": None,
+            "limit": 10,
+            "offset": None,
+        }
+
+
+class TestLangsmithTool:
+    """Tests for the _langsmith_tool decorator."""
+
+    async def test_tool_schema_and_call(self, rt, monkeypatch):
+        client = FakeClient()
+        monkeypatch.setattr(rt, "get_client_from_context", lambda ctx: client)
+        monkeypatch.setattr(
+            rt,
+            "read_dataset_tool",
+            lambda c, dataset_id=None, dataset_name=None: {"client": c is client, "id": dataset_id},
+        )
+
+        mcp = FastMCP("test")
+        mcp.tool()(rt.read_dataset)
+        async with FastMCPClient(mcp) as mcp_client:
+            tools = await mcp_client.list_tools()
+            result = await mcp_client.call_tool("read_dataset", {"dataset_id": "ds-1"})
+
+        assert set(tools[0].inputSchema["properties"]) == {"dataset_id", "dataset_name"}
+        assert result.data == {"client": True, "id": "ds-1"}
+
+    def test_exceptions_become_errors(self, rt, monkeypatch):
+
+        def boom(ctx):
+            raise ValueError("API key not found")
+
+        monkeypatch.setattr(rt, "get_client_from_context", boom)
+        assert rt.read_example("ex-1") == {"error": "API key not found"}
+
+    async def test_uses_client_from_middleware(self, rt, monkeypatch):
+        monkeypatch.setenv("LANGSMITH_API_KEY", "lsv2_test_key")
+        seen = []
+        monkeypatch.setattr(
+            rt,
+            "read_dataset_tool",
+            lambda c, **kwargs: seen.append((c, client_context.get())) or {"dataset": {}},
+        )
+
+        mcp = FastMCP("test")
+        mcp.add_middleware(LangSmithClientMiddleware())
+        mcp.tool()(rt.read_dataset)
+        with patch("langsmith_mcp_server.common.helpers.Client", return_value=Mock()):
+            async with FastMCPClient(mcp) as mcp_client:
+                await mcp_client.call_tool("read_dataset", {"dataset_id": "ds-1"})
+        _clear_client_cache()
+
+        ((client, context_client),) = seen
+        assert client is context_client is not None
@@ -0,0 +1,75 @@
+"""Tests for trace tools."""
+
+from unittest.mock import Mock
+from uuid import UUID
+
+import pytest
+
+from langsmith_mcp_server.services.tools.traces import (
+    FetchRunsParams,
+    fetch_runs_tool,
+    iter_runs_tool,
+)
+
+
+class MockRun:
+    """Mock run object to simulate LangSmith run responses."""
+
+    def __init__(self, id: str, name: str = "ChatOpenAI"):
+        self.id = UUID(id)
+        self.name = name
+
+    def dict(self):
+        return {"id": self.id, "name": self.name}
+
+
+@pytest.fixture
+def mock_client():
+    """Create a mock LangSmith client returning two runs."""
+    client = Mock()
+    client.list_runs.return_value = iter(
+        [
+            MockRun("123e4567-e89b-12d3-a456-426614174000"),
+            MockRun("123e4567-e89b-12d3-a456-426614174001", name="extractor"),
+        ]
+    )
+    return client
+
+
+class TestIterRunsTool:
+    """Tests for iter_runs_tool."""
+
+    def test_is_lazy(self, mock_client):
+        runs = iter_runs_tool(mock_client, FetchRunsParams(project_name="alpha-project"))
+        mock_client.list_runs.assert_not_called()
+
+        first = next(runs)
+
+        assert first == {"id": "123e4567-e89b-12d3-a456-426614174000", "name": "ChatOpenAI"}
+        mock_client.list_runs.assert_called_once()
+
+    def test_forwards_arguments(self, mock_client):
+        params = FetchRunsParams(
+            project_name=["alpha-project", "beta-project"],
+            is_root=True,
+            filter='eq(name,"extractor")',
+            limit=10,
+        )
+        list(iter_runs_tool(mock_client, params))
+
+        call_kwargs = mock_client.list_runs.call_args[1]
+        assert call_kwargs["project_name"] == ["alpha-project", "beta-project"]
+        assert call_kwargs["is_root"] is True
+        assert call_kwargs["filter"] == 'eq(name,"extractor")'
+        assert call_kwargs["limit"] == 10
+        assert call_kwargs["order_by"] == "-start_time"
+
+
+class TestFetchRunsTool:
+    """Tests for fetch_runs_tool."""
+
+    def test_returns_all_runs(self, mock_client):
+        result = fetch_runs_tool(mock_client, FetchRunsParams(project_name="alpha-project"))
+
+        assert [run["name"] for run in result["runs"]] == ["ChatOpenAI", "extractor"]
+        assert result["runs"][1]["id"] == "123e4567-e89b-12d3-a456-426614174001"